@@ -1,5 +1,10 @@
 import sys
-from src.whack_a_zombie import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--server" in sys.argv[1:]:
+        # Headless authoritative server, no window is opened
+        from src.server import main
+        main([arg for arg in sys.argv[1:] if arg != "--server"])
+    else:
+        from src.whack_a_zombie import main
+        main()
@@ -1,6 +1,9 @@
 import pygame as pg
-import os
-from typing import Tuple, Callable
+from typing import Tuple, Callable, List, Optional
+try:
+    from .resources import RESOURCES
+except ImportError:
+    from resources import RESOURCES
 
 class ReplayBoard:
     def __init__(self, screen: pg.Surface, font_size: int = 28):
@@ -9,11 +12,11 @@ class ReplayBoard:
         self.screen_height = screen.get_height()
         
         # Font setup
-        font_path = os.path.join('assets', 'Fonts', 'Minecraft.ttf')
+        font_path = "Fonts/Minecraft.ttf"   # shared with ScoreBoard through RESOURCES
         try:
-            self.large_font = pg.font.Font(font_path, font_size * 2)  # Larger font for title
-            self.font = pg.font.Font(font_path, font_size)
-            self.button_font = pg.font.Font(font_path, font_size)
+            self.large_font = RESOURCES.font(font_path, font_size * 2)  # Larger font for title
+            self.font = RESOURCES.font(font_path, font_size)
+            self.button_font = RESOURCES.font(font_path, font_size)
         except FileNotFoundError:
             # Fallback to system font if file not found
             self.large_font = pg.font.SysFont(None, font_size * 2)
@@ -59,6 +62,12 @@ class ReplayBoard:
             button_height
         )
         
+        # Darkens the finished round behind the panel (same kind of overlay as the menu's)
+        self.use_overlay = True
+        self.overlay = pg.Surface((self.screen_width, self.screen_height)).convert()
+        self.overlay.fill((0, 0, 0))
+        self.overlay.set_alpha(180)  # Black with 70% opacity
+
         # Hover state
         self.replay_hover = False
         self.menu_hover = False
@@ -93,15 +102,15 @@ class ReplayBoard:
                 
         return None
         
-    def draw(self, score: int, hits: int, misses: int):
+    def draw(self, score: int, hits: int, misses: int,
+             rankings: Optional[List[Tuple]] = None, played_at: Optional[float] = None):
         """Draw the replay board with game stats"""
         # Calculate accuracy
         accuracy = self.calculate_accuracy(hits, misses)
         
         # Semi-transparent overlay
-        overlay = pg.Surface((self.screen_width, self.screen_height), pg.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Black with 70% opacity
-        self.screen.blit(overlay, (0, 0))
+        if self.use_overlay:
+            self.screen.blit(self.overlay, (0, 0))
         
         # Draw panel background
         pg.draw.rect(self.screen, (50, 50, 50), self.panel_rect, border_radius=10)
@@ -144,3 +153,31 @@ class ReplayBoard:
         menu_text = self.button_font.render("Menu (M)", True, self.button_text_color)
         menu_text_rect = menu_text.get_rect(center=self.menu_button_rect.center)
         self.screen.blit(menu_text, menu_text_rect)
+
+        # Draw leaderboard below the panel
+        if rankings:
+            self.draw_rankings(rankings, played_at)
+
+    def draw_rankings(self, rankings: List[Tuple], played_at: Optional[float] = None):
+        """Draw the top scores for the current difficulty"""
+        line_height = self.font.get_linesize()
+        rank_rect = pg.Rect(
+            self.panel_rect.left,
+            self.panel_rect.bottom + 15,
+            self.panel_width,
+            line_height * (len(rankings) + 1) + 20
+        )
+        pg.draw.rect(self.screen, (50, 50, 50), rank_rect, border_radius=10)
+        pg.draw.rect(self.screen, (80, 80, 80), rank_rect, width=3, border_radius=10)
+
+        header_text = self.font.render("Top Scores", True, self.highlight_color)
+        header_rect = header_text.get_rect(centerx=rank_rect.centerx, top=rank_rect.top + 10)
+        self.screen.blit(header_text, header_rect)
+
+        for i, (entry_score, entry_hits, entry_misses, created_at) in enumerate(rankings):
+            # Highlight the game that was just played, if it made the list
+            color = self.highlight_color if created_at == played_at else self.text_color
+            accuracy = self.calculate_accuracy(entry_hits, entry_misses)
+            row_text = self.font.render(f"{i + 1}. {entry_score}  ({accuracy:.0f}%)", True, color)
+            row_rect = row_text.get_rect(centerx=rank_rect.centerx, top=header_rect.bottom + i * line_height)
+            self.screen.blit(row_text, row_rect)
@@ -1,6 +1,9 @@
 import pygame as pg
 from typing import Tuple
-import os
+try:
+    from .resources import RESOURCES
+except ImportError:
+    from resources import RESOURCES
 
 class ScoreBoard:
     def __init__(self, screen: pg.Surface, font_size: int = 28, 
@@ -16,12 +19,12 @@ class ScoreBoard:
         
         # Font setup
         self.font_name = font_name
-        font_path = os.path.join('assets', 'Fonts', 'Minecraft.ttf')
         try:
-            self.font = pg.font.Font(font_path, font_size)
+            self.font = RESOURCES.font("Fonts/Minecraft.ttf", font_size)
         except FileNotFoundError:
             # Fallback to system font if file not found
             self.font = pg.font.SysFont(self.font_name, font_size)
+        self.antialias = True
         # Colors
         self.text_color = (255, 255, 255)
         self.warning_color = (255, 0, 0)
@@ -41,6 +44,13 @@ class ScoreBoard:
         # Return False when time is up to end the game
         return self.time_remaining > 0
     
+    def sync(self, score: int, hits: int, misses: int, time_remaining: int):
+        """Show the state of a round run elsewhere (engine.GameSession)"""
+        self.score = score
+        self.hits = hits
+        self.misses = misses
+        self.time_remaining = max(0, time_remaining)
+
     def increase_score(self, points: int = 1):
         """Increase player's score"""
         self.score += points
@@ -53,16 +63,16 @@ class ScoreBoard:
     def draw(self):
         """Render the scoreboard on screen"""
         # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, self.text_color)
+        score_text = self.font.render(f"Score: {self.score}", self.antialias, self.text_color)
         self.screen.blit(score_text, self.score_pos)
         
         # Draw misses
-        misses_text = self.font.render(f"Misses: {self.misses}", True, self.text_color)
+        misses_text = self.font.render(f"Misses: {self.misses}", self.antialias, self.text_color)
         self.screen.blit(misses_text, self.misses_pos)
         
         # Draw timer (red when low on time)
         color = self.warning_color if self.time_remaining < 5 else self.text_color
-        timer_text = self.font.render(f"Time: {self.time_remaining}", True, color)
+        timer_text = self.font.render(f"Time: {self.time_remaining}", self.antialias, color)
         self.screen.blit(timer_text, self.timer_pos)
     
     def reset(self):
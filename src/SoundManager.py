@@ -1,6 +1,10 @@
 from pathlib import Path
 import os
 import pygame
+try:
+    from .resources import RESOURCES
+except ImportError:
+    from resources import RESOURCES
 
 ASSETS = Path(__file__).resolve().parent.parent / "assets" / "Sounds" 
 class SoundManager:
@@ -15,6 +19,11 @@ class SoundManager:
         self.sfx_miss_volume = 0.3
         self._load_sounds()
     
+    @staticmethod
+    def asset_paths():
+        """ Sound effects loaded by _load_sounds, for the background loader """
+        return [ASSETS / "Sfx" / "Hit.wav", ASSETS / "Sfx" / "Miss.wav"]
+
     def _load_sounds(self):
         # Hit sound effect
         hit_sfx_path = str(ASSETS / "Sfx" / "Hit.wav")
@@ -23,12 +32,12 @@ class SoundManager:
         miss_sfx_path = str(ASSETS / "Sfx" / "Miss.wav")
 
         if os.path.exists(hit_sfx_path):
-            self.sounds["hit"] = pygame.mixer.Sound(hit_sfx_path)
+            self.sounds["hit"] = RESOURCES.sound(hit_sfx_path)
         else:
             print(f"Warning: Sound file '{hit_sfx_path}' not found")
 
         if os.path.exists(miss_sfx_path):
-            self.sounds["miss"] = pygame.mixer.Sound(miss_sfx_path)
+            self.sounds["miss"] = RESOURCES.sound(miss_sfx_path)
         else:
             print(f"Warning: Sound file '{miss_sfx_path}' not found")
             
@@ -2,6 +2,10 @@ from pathlib import Path
 import random
 import pygame as pg
 from typing import List
+try:
+    from .resources import RESOURCES
+except ImportError:
+    from resources import RESOURCES
 
 # Images for the Background
 ASSETS = Path(__file__).resolve().parent.parent / "assets" / "images" / "background"
@@ -12,10 +16,10 @@ class Background:
         self.rng = random.Random(seed)
 
         # preload
-        self.tiles = {i: pg.image.load(str(ASSETS / f"tile{i}.png")).convert() for i in range(1,10)}
-        self.grass1 = pg.image.load(str(ASSETS / "grass1.png")).convert()
-        self.grass2 = pg.image.load(str(ASSETS / "grass2.png")).convert()
-        self.hole   = pg.image.load(str(ASSETS / "hole.png")).convert()
+        self.tiles = {i: RESOURCES.image(ASSETS / f"tile{i}.png", alpha=False) for i in range(1,10)}
+        self.grass1 = RESOURCES.image(ASSETS / "grass1.png", alpha=False)
+        self.grass2 = RESOURCES.image(ASSETS / "grass2.png", alpha=False)
+        self.hole   = RESOURCES.image(ASSETS / "hole.png", alpha=False)
 
         # Draw Random Grass 
         w, h = screen.get_size()
@@ -29,6 +33,15 @@ class Background:
                     continue
                 self.grass_map[r][c] = 1 if g < 93 else 2  # 1: grass1, 2: grass2
 
+        # Pre-rendered backgrounds keyed by screen size
+        self.static_cache = {}
+
+    @staticmethod
+    def asset_paths() -> List[Path]:
+        """ Image files loaded by __init__, for the background loader """
+        names = [f"tile{i}.png" for i in range(1, 10)] + ["grass1.png", "grass2.png", "hole.png"]
+        return [ASSETS / n for n in names]
+
     def bg_tile_map(self, rows, cols):
         tile_map = [[5 for _ in range(cols)] for _ in range(rows)]
         for i in range(rows):
@@ -43,10 +56,12 @@ class Background:
         tile_map[rows - 1][cols - 1] = 9
         return tile_map
 
-    def draw(self, hole_positions: List):
+    def render_static(self) -> pg.Surface:
+        """ Tiles (and grass) never move, so they are drawn once onto one surface """
         w, h = self.screen.get_size()
         cols = round(w / self.tile_size)
         rows = round(h / self.tile_size)
+        surface = pg.Surface((w, h)).convert()
 
         tile_map = self.bg_tile_map(rows, cols)
 
@@ -54,17 +69,24 @@ class Background:
         for r in range(rows):
             for c in range(cols):
                 num = tile_map[r][c]
-                self.screen.blit(self.tiles[num], (c*self.tile_size, r*self.tile_size))
+                surface.blit(self.tiles[num], (c*self.tile_size, r*self.tile_size))
 
         # add grass
         for r in range(1, self.rows):
             for c in range(1, self.cols):
                 if self.grass_map[r][c] == 1:
-                    self.screen.blit(self.grass1, (c * self.tile_size, r * self.tile_size))
+                    surface.blit(self.grass1, (c * self.tile_size, r * self.tile_size))
                 elif self.grass_map[r][c] == 2:
-                    self.screen.blit(self.grass2, (c * self.tile_size, r * self.tile_size))
-        
+                    surface.blit(self.grass2, (c * self.tile_size, r * self.tile_size))
+        return surface
+
+    def draw(self, hole_positions: List):
+        key = self.screen.get_size()
+        static = self.static_cache.get(key)
+        if static is None:
+            static = self.static_cache[key] = self.render_static()
+        self.screen.blit(static, (0, 0))
+
         # punch holes
         for x, y in hole_positions:
             self.screen.blit(self.hole, (int(x), int(y)))
-                                                                                                                                  
@@ -0,0 +1,225 @@
+# src/bots.py
+""" Synthetic players
+
+A `Bot` turns "a zombie appeared at (x, y)" into clicks with a human-like
+reaction time, accuracy and maximum click rate. It can play either:
+  - the real game loop, through `PygameDriver` passed as `main(frame_hook=...)`,
+    which posts MOUSEBUTTONDOWN events to pygame's queue, or
+  - a headless `GameSession` directly, through `play_session`.
+
+Both keep track of the clicks the bot meant to land so the number of hits
+the game registered can be checked against it.
+"""
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import pygame as pg
+try:
+    from .engine import GameSession, ZOMBIE_SIZE
+except ImportError:
+    from engine import GameSession, ZOMBIE_SIZE
+
+HitTest = Callable[[Tuple[int, int], Tuple[float, float]], bool]     # (click, zombie center) -> hit
+
+
+class BotProfile:
+    """ How a bot plays """
+    def __init__(self, reaction_time: float = 0.30, reaction_jitter: float = 0.08,
+                 accuracy: float = 0.85, click_rate: float = 6.0,
+                 hit_radius: float = ZOMBIE_SIZE / 2):
+        self.reaction_time = reaction_time        # mean seconds from spawn to click
+        self.reaction_jitter = reaction_jitter    # stddev of the reaction time
+        self.accuracy = accuracy                  # chance that a click is aimed on target
+        self.click_rate = click_rate              # max clicks per second
+        self.hit_radius = hit_radius              # half the size of the sprite it aims at
+
+PROFILES = {
+    "casual": BotProfile(reaction_time=0.45, reaction_jitter=0.12, accuracy=0.7, click_rate=3.0),
+    "average": BotProfile(),
+    "pro": BotProfile(reaction_time=0.20, reaction_jitter=0.04, accuracy=0.97, click_rate=10.0),
+}
+
+
+class Bot:
+    def __init__(self, profile: BotProfile, seed: Optional[int] = None):
+        self.profile = profile
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        """ Forget the current target and click timing (new round or new clock) """
+        self.spawn = None
+        self.target: Optional[Tuple[float, float]] = None
+        self.due = math.inf
+        self.last_click = -math.inf
+
+    def observe(self, spawn, target: Optional[Tuple[float, float]], now: float):
+        """ Tell the bot what is on screen; `target` is None when nothing can be hit """
+        if target is None:
+            self.target = None
+            self.due = math.inf
+            return
+        if spawn != self.spawn:
+            self.spawn = spawn
+            self.target = target
+            self.due = now + self.reaction()
+
+    def reaction(self) -> float:
+        p = self.profile
+        return max(0.05, self.rng.gauss(p.reaction_time, p.reaction_jitter))
+
+    def poll(self, now: float, hit_test: Optional[HitTest] = None) -> Optional[Tuple[Tuple[float, float], bool]]:
+        """ Click due at `now` as (pos, aimed_on_target), or None
+
+        With `hit_test` (the zombie's pixel test) an aimed click always lands
+        on the sprite and a stray one never does, so `accuracy` keeps meaning
+        the share of clicks that hit.
+        """
+        if self.target is None or now < self.due:
+            return None
+        if now - self.last_click < 1.0 / self.profile.click_rate:
+            return None
+        self.last_click = now
+
+        on_target = self.rng.random() < self.profile.accuracy
+        pos = self.aim(self.target, on_target, hit_test)
+        if on_target:
+            self.target = None
+            self.due = math.inf
+        else:
+            # Missed: try again after another (shorter) reaction
+            self.due = now + self.reaction() / 2
+        return pos, on_target
+
+    def aim(self, target: Tuple[float, float], on_target: bool,
+            hit_test: Optional[HitTest] = None, tries: int = 20) -> Tuple[int, int]:
+        r = self.profile.hit_radius
+        for _ in range(tries):
+            angle = self.rng.uniform(0, 2 * math.pi)
+            if on_target:
+                dist = r * math.sqrt(self.rng.random())
+            else:
+                dist = r * self.rng.uniform(1.2, 2.0)
+            pos = (int(target[0] + dist * math.cos(angle)),
+                   int(target[1] + dist * math.sin(angle)))
+            if hit_test is None or hit_test(pos, target) == on_target:
+                break
+        return pos
+
+
+class BotReport:
+    """ What a bot saw and did, comparable across drivers """
+    def __init__(self):
+        self.games: List[Dict] = []
+        self.clicks = 0
+        self.frame_ms: List[float] = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def add_game(self, registered: int, expected: int, score: int, misses: int):
+        self.games.append({"registered": registered, "expected": expected,
+                           "score": score, "misses": misses})
+
+    def as_dict(self) -> Dict:
+        return {
+            "games": self.games,
+            "clicks": self.clicks,
+            "frame_ms": self.frame_ms,
+            "elapsed": self.elapsed,
+        }
+
+
+class PygameDriver:
+    """ Drives `whack_a_zombie.main()` through pygame's event queue
+
+    Pass an instance as `main(frame_hook=driver)`. It navigates the menu,
+    plays `games` rounds and then posts QUIT.
+    """
+    def __init__(self, bot: Bot, games: int = 1, difficulty: int = 0, fps: float = 60.0):
+        self.bot = bot
+        self.games = games
+        self.difficulty = difficulty
+        self.frame = 1.0 / fps
+        self.report = BotReport()
+        self.expected = 0
+        self.in_replay = False
+        self.quitting = False
+
+    def post_click(self, pos):
+        pg.event.post(pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+        pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=pos, button=1))
+
+    def __call__(self, snap: Dict):
+        now = snap["time"]
+        self.report.frame_ms.append(snap["frame_ms"])
+        if self.quitting:
+            return
+
+        if snap["show_menu"]:
+            if snap["difficulty"] != self.difficulty:
+                self.post_click(snap["right_arrow"])
+            else:
+                self.post_click(snap["play_button"])
+            return
+
+        if snap["show_replay_board"]:
+            if not self.in_replay:
+                self.in_replay = True
+                self.report.add_game(snap["hits"], self.expected, snap["score"], snap["misses"])
+                self.expected = 0
+            if len(self.report.games) >= self.games:
+                self.quitting = True
+                self.report.elapsed = time.perf_counter() - self.report.started
+                pg.event.post(pg.event.Event(pg.QUIT))
+            else:
+                pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_r, mod=0, unicode="r", scancode=0))
+            return
+
+        self.in_replay = False
+        if not snap["playing"]:
+            return
+        target = snap["target"]
+        self.bot.observe(snap["spawn"], target, now)
+        click = self.bot.poll(now, snap["hit_test"])
+        if click is None:
+            return
+        pos, _ = click
+        # The click is handled next frame; only count it if the zombie will still be up
+        if target is not None and snap["hit_test"](pos, target) and snap["stay"] > 2 * self.frame:
+            self.expected += 1
+        self.report.clicks += 1
+        pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=pos, button=1))
+
+
+def play_session(bot: Bot, difficulty: int = 0, time_limit: float = 20.0,
+                 dt: float = 1 / 60, seed: Optional[int] = None,
+                 report: Optional[BotReport] = None) -> BotReport:
+    """ Play one round of a headless `GameSession` in simulated time """
+    report = report or BotReport()
+    session = GameSession(difficulty, time_limit, seed=seed)
+    session.start()
+    bot.reset()     # simulated time restarts at 0 every round
+
+    now = 0.0
+    expected = 0
+    while not session.finished:
+        t0 = time.perf_counter()
+        zombie = session.zombie
+        target = session.current_pos if zombie.is_target else None
+        bot.observe(zombie.spawns, target, now)
+        click = bot.poll(now, zombie.hit_test)
+        if click is not None:
+            pos, _ = click
+            report.clicks += 1
+            if target is not None and zombie.hit_test(pos, target):
+                expected += 1
+            session.click(pos)
+        session.tick(dt)
+        session.drain_events()
+        report.frame_ms.append((time.perf_counter() - t0) * 1000)
+        now += dt
+
+    report.add_game(session.hits, expected, session.score, session.misses)
+    report.elapsed = time.perf_counter() - report.started
+    return report
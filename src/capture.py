@@ -0,0 +1,173 @@
+# src/capture.py
+""" In-game capture to a background encoder process
+
+After each present the display surface is copied straight from its pixel
+buffer (`Surface.get_view`) into a slot of a shared-memory ring: one
+memcpy, no Python-level pixel copies. A separate process writes the slots
+out as one raw frame file (plus a JSON header) or as a PNG sequence.
+
+If every slot is still waiting to be written the frame is dropped, so a
+slow disk never stalls the game.
+
+WAZ_CAPTURE=<dir> starts capturing at launch, F9 toggles it in game.
+WAZ_CAPTURE_FORMAT=raw|png, WAZ_CAPTURE_EVERY=<n> keeps every n-th frame.
+"""
+import itertools
+import json
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+from typing import Dict, Optional
+import pygame as pg
+
+CAPTURES = Path(__file__).resolve().parent.parent / "captures"
+FORMATS = ("raw", "png")
+
+
+class FrameCapture:
+    def __init__(self, surface: pg.Surface, out_dir: Optional[Path] = None,
+                 fmt: Optional[str] = None, slots: int = 8, every: Optional[int] = None):
+        fmt = fmt or os.environ.get("WAZ_CAPTURE_FORMAT", "raw")
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown capture format '{fmt}', expected one of {FORMATS}")
+        self.surface = surface
+        self.every = parse_every(every if every is not None else os.environ.get("WAZ_CAPTURE_EVERY", "1"))
+        if out_dir:
+            self.out_dir = Path(out_dir)
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self.out_dir = new_capture_dir()
+
+        self.header = {
+            "width": surface.get_width(),
+            "height": surface.get_height(),
+            "pitch": surface.get_pitch(),
+            "bytes_per_pixel": surface.get_bytesize(),
+            "masks": list(surface.get_masks()),
+            "format": fmt,
+        }
+        self.frame_bytes = surface.get_pitch() * surface.get_height()
+        self.slots = slots
+        self.shm = shared_memory.SharedMemory(create=True, size=slots * self.frame_bytes)
+
+        ctx = mp.get_context("spawn")
+        self.free = ctx.Queue()
+        self.filled = ctx.Queue()
+        for slot in range(slots):
+            self.free.put(slot)
+        self.process = ctx.Process(target=encode, name="capture-encoder", daemon=True,
+                                   args=(self.shm.name, self.frame_bytes, self.header,
+                                         str(self.out_dir), self.free, self.filled))
+        self.process.start()
+
+        self.frame = 0
+        self.captured = 0
+        self.dropped = 0
+        print(f"[Capture] Recording {fmt} frames to {self.out_dir}")
+
+    def grab(self):
+        """ Copy the presented frame into shared memory, or drop it """
+        self.frame += 1
+        if self.frame % self.every:
+            return
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return
+
+        start = slot * self.frame_bytes
+        view = memoryview(self.surface.get_view("0"))
+        self.shm.buf[start:start + self.frame_bytes] = view
+        view.release()      # unlocks the surface again
+        self.filled.put((slot, self.frame, time.perf_counter()))
+        self.captured += 1
+
+    def close(self, wait: bool = True):
+        """ Stop recording; with wait=False the encoder drains on its own and is reaped
+        on a (non-daemon) thread, so stopping mid-game doesn't stall a frame """
+        self.filled.put(None)
+        if wait:
+            self.finish()
+        else:
+            threading.Thread(target=self.finish, name="capture-reaper").start()
+
+    def finish(self):
+        self.process.join(timeout=30)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.shm.close()
+        self.shm.unlink()
+        print(f"[Capture] {self.stats()}")
+
+    def stats(self) -> Dict:
+        return {"captured": self.captured, "dropped": self.dropped, "dir": str(self.out_dir)}
+
+
+def parse_every(value) -> int:
+    try:
+        every = int(value)
+    except (TypeError, ValueError):
+        every = 0
+    if every < 1:
+        print(f"Warning: invalid capture interval '{value}', expected a whole number >= 1, keeping every frame")
+        return 1
+    return every
+
+
+def new_capture_dir(root: Path = CAPTURES) -> Path:
+    """ A folder of its own per capture: a capture started within the same
+    second as the previous one must not write over it while it drains """
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    for n in itertools.count(1):
+        path = root / (stamp if n == 1 else f"{stamp}-{n}")
+        try:
+            path.mkdir(parents=True)
+            return path
+        except FileExistsError:
+            continue
+
+
+def encode(shm_name: str, frame_bytes: int, header: Dict, out_dir: str,
+           free: "mp.Queue", filled: "mp.Queue"):
+    """ Encoder process: drain filled slots to disk and hand them back """
+    import numpy as np
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    out = Path(out_dir)
+    w, h, pitch = header["width"], header["height"], header["pitch"]
+    bpp = header["bytes_per_pixel"]
+    frames = []
+
+    # Byte offset of R, G and B inside a pixel (little-endian masks)
+    channels = [header["masks"][i].bit_length() // 8 - 1 for i in range(3)]
+
+    raw = open(out / "frames.raw", "wb") if header["format"] == "raw" else None
+    try:
+        while True:
+            item = filled.get()
+            if item is None:
+                break
+            slot, number, stamp = item
+            data = shm.buf[slot * frame_bytes:(slot + 1) * frame_bytes]
+            if raw:
+                raw.write(data)
+            else:
+                pixels = np.frombuffer(data, np.uint8).reshape(h, pitch)[:, :w * bpp].reshape(h, w, bpp)
+                rgb = np.ascontiguousarray(pixels[:, :, channels])
+                image = pg.image.frombuffer(rgb, (w, h), "RGB")
+                pg.image.save(image, str(out / f"frame_{number:06d}.png"))
+                del image, rgb, pixels
+            data.release()
+            free.put(slot)
+            frames.append({"frame": number, "time": stamp})
+    finally:
+        if raw:
+            raw.close()
+        with open(out / "capture.json", "w") as f:
+            json.dump({**header, "frames": frames}, f)
+        shm.close()
@@ -1,17 +1,26 @@
 import pygame as pg
 from pathlib import Path
+try:
+    from .resources import RESOURCES
+except ImportError:
+    from resources import RESOURCES
 
 ASSETS = Path(__file__).resolve().parent.parent / "assets" / "images" / "cursor"
 
 class Cursor:
     def __init__(self, screen: pg.Surface):
-        self.img_up = pg.image.load(str(ASSETS / "hammer0.png")).convert_alpha()
-        self.img_down = pg.image.load(str(ASSETS / "hammer1.png")).convert_alpha()
+        self.img_up = RESOURCES.image(ASSETS / "hammer0.png")
+        self.img_down = RESOURCES.image(ASSETS / "hammer1.png")
         self.image = self.img_up
         self.rect = self.image.get_rect()
         self.screen = screen
         self.hold_timer = 0.0
 
+    @staticmethod
+    def asset_paths():
+        """ Image files loaded by __init__, for the background loader """
+        return [ASSETS / "hammer0.png", ASSETS / "hammer1.png"]
+
     def mouse_down(self):
         self.image = self.img_down  
         self.hold_timer = 0.12
@@ -25,7 +34,8 @@ class Cursor:
             if self.hold_timer <= 0:
                 self.mouse_up()
 
-    def draw(self, dt): 
+    def draw(self, dt, pos=None):
+        """ Draw at `pos` (logical coordinates), or the raw mouse position """
         self.update(dt)
-        self.rect.center = pg.mouse.get_pos()
+        self.rect.center = pos if pos is not None else pg.mouse.get_pos()
         self.screen.blit(self.image, self.rect)
\ No newline at end of file
@@ -0,0 +1,319 @@
+# src/engine.py
+""" Headless game rules shared by the pygame client and the server
+
+Spawning, hit validation, the zombie's idle/death timers and the round
+timer only need positions and dt. The one exception is hit testing: a
+click is a hit on exactly the pixels the client draws. The client builds
+pygame bitmasks from the frames it draws; without a display the frames
+are loaded (never converted or displayed) to build the same masks.
+"""
+from pathlib import Path
+import math
+import random
+import re
+from typing import Dict, List, Optional, Tuple
+
+ASSETS = Path(__file__).resolve().parent.parent / "assets" / "images" / "zombies"
+
+SCREEN_SIZE = (1024, 768)
+TILE_SIZE = 64
+HOLE_SIZE = 128
+ZOMBIE_SIZE = 64            # Zombie frames are drawn (and hit tested) at this size
+NUM_SPAWNS = [6, 9, 12]     # Hole layout per difficulty (6 -> 9 -> 12)
+GAME_TIME = 20
+SCORE_PER_HIT = 1
+
+
+""" Layout """
+def gen_pos(cols: int, rows: int, size: Tuple[int, int] = SCREEN_SIZE) -> List[List]:
+    """ Generate positions for Holes """
+    w, h = size
+    padding_col = (w - HOLE_SIZE * cols) / (cols + 1)
+    padding_row = (h - HOLE_SIZE * rows) / (rows + 1)
+
+    grid = [[None]*cols for _ in range(rows)]
+    for r in range(rows):
+        y = r * HOLE_SIZE + (r + 1) * padding_row
+        for c in range(cols):
+            x = c * HOLE_SIZE + (c + 1) * padding_col
+            grid[r][c] = (int(x), int(y))
+    return grid
+
+def holes_grid(num_spawns: int, size: Tuple[int, int] = SCREEN_SIZE) -> List[List]:
+    """ Grid of hole positions for a number of spawns """
+    match num_spawns:
+        case (6 | 9) as n:
+            return gen_pos(3, n // 3, size)
+        case 12 as n:
+            return gen_pos(4, n // 4, size)
+        case _:
+            raise ValueError(f"Unexpected: {num_spawns}")
+
+def center_pos(pos: Tuple[float, float]) -> Tuple[float, float]:
+    """ Centering the Position """
+    x, y = pos
+    return (x + HOLE_SIZE / 2, y + HOLE_SIZE / 2)
+
+def collide(mouse_pos, spawn_pos: Tuple[float, float], radius: float = TILE_SIZE) -> bool:
+    """ Check if Zombie is clicked or not """
+    x_mouse, y_mouse = mouse_pos
+    x_center, y_center = spawn_pos
+    distance = math.sqrt(
+        math.pow(x_mouse - x_center, 2) + \
+        math.pow(y_mouse - y_center, 2)
+    )
+    return distance <= radius
+
+def numeric_key(p: Path):
+    m = re.findall(r'(\d+)', p.stem)
+    return [int(x) for x in m] if m else [p.stem]
+
+def frame_paths(folder: Path) -> List[Path]:
+    """ Animation frames of a sprite folder, in order """
+    return sorted(folder.glob("*.png"), key = numeric_key)
+
+MASKS: Dict[Tuple[int, int], Tuple[List, List]] = {}
+
+def zombie_masks(size: Tuple[int, int] = (ZOMBIE_SIZE, ZOMBIE_SIZE),
+                 frames: Optional[Tuple[List, List]] = None) -> Tuple[List, List]:
+    """ Opaque-pixel masks of the idle and death frames at a drawn size, built once
+
+    The client passes the idle and death frames it already loaded (at `size`);
+    without them the files are read here. Both give the same masks: frames
+    are scaled nearest-neighbour, like Mask.scale.
+    """
+    size = (int(size[0]), int(size[1]))
+    if size not in MASKS:
+        import pygame as pg     # bitmasks only: no display or pg.init() needed
+        if frames is None:
+            MASKS[size] = tuple(
+                [pg.mask.from_surface(pg.image.load(str(p))).scale(size) for p in frame_paths(ASSETS / name)]
+                for name in ("idle", "death"))
+        else:
+            MASKS[size] = tuple([pg.mask.from_surface(f) for f in group] for group in frames)
+    return MASKS[size]
+
+
+class ZombieState:
+    """ Animation and timers of a zombie, without any visuals """
+    def __init__(self, idle_count: int, death_count: int,
+                 idle_fps: float = 10.0, death_fps: float = 12.0,
+                 linger_after_death: float = 0.4, masks: Optional[Tuple[List, List]] = None):
+        self.idle_count = idle_count
+        self.death_count = death_count
+        self.idle_fps = idle_fps
+        self.death_fps = death_fps
+        self.linger_after_death = linger_after_death
+        self.idle_masks, self.death_masks = masks or (None, None)
+
+        # State
+        self.state: str = "idle"   # "idle" | "death"
+        self.index: int = 0
+        self.shown_index: int = 0  # Frame on screen, may lag `index` (see Zombies.anim_stride)
+        self.accum: float = 0.0
+        self.frame_time: float = 1.0 / self.idle_fps
+        self.loop: bool = True
+        self.finished: bool = False
+        self.linger: float = 0.0
+        self.hit: bool = False
+
+        # Property
+        self.idle_cycle = (self.idle_count / self.idle_fps) if self.idle_fps > 0 else 0.6
+        self.stay_timer = 2.0 * self.idle_cycle
+        self.respawn_delay = 0.1
+        self.respawn_timer = 0.0
+        self.spawns = 0             # Bumped on every reset, lets observers tell spawns apart
+
+    def reset(self):
+        """ Reset Properies """
+        self.idle_cycle = (self.idle_count / self.idle_fps) if self.idle_fps > 0 else 0.6
+        self.stay_timer = 2.0 * self.idle_cycle
+        self.respawn_timer = 0.0
+        self.hit = False
+        self.spawns += 1
+
+    # --- Controls ---
+    def play_idle(self):
+        """ Setting for Idle state """
+        self.state = "idle"
+        self.index = self.shown_index = 0
+        self.accum = 0.0
+        self.frame_time = 1.0 / self.idle_fps
+        self.loop = True
+        self.finished = False
+        self.linger = 0.0
+
+    def play_death(self):
+        """ Setting for Death state """
+        self.state = "death"
+        self.index = self.shown_index = 0
+        self.accum = 0.0
+        self.frame_time = 1.0 / self.death_fps
+        self.loop = False
+        self.finished = False
+        self.linger = 0.0
+
+    # --- Update ---
+    def step_frame(self):
+        """ Moving to next Frame """
+        count = self.idle_count if self.state == "idle" else self.death_count
+        if not count:
+            return
+
+        self.index += 1
+        if self.index >= count:
+            if self.loop:
+                self.index = 0
+            else:
+                """ Delaying Time for Death state """
+                self.index = count - 1
+                self.finished = True
+                self.linger = self.linger_after_death
+        self.shown_index = self.index
+
+    def update(self, dt: float):
+        """ Update new Frame """
+        if self.finished:
+            if self.linger > 0:
+                self.linger -= dt
+            return
+
+        self.accum += dt
+        while self.accum >= self.frame_time:
+            self.accum -= self.frame_time
+            self.step_frame()
+
+    def hit_test(self, pos, center_pos: Tuple[float, float]) -> bool:
+        """ Click on an opaque pixel of the frame shown centered at `center_pos` """
+        masks = self.idle_masks if self.state == "idle" else self.death_masks
+        if not masks:
+            return collide(pos, center_pos)
+        mask = masks[min(self.shown_index, len(masks) - 1)]
+        w, h = mask.get_size()
+        # Same placement as Rect(center=...) in Zombies.draw, then the bounding-rect reject
+        x = int(pos[0]) - (int(center_pos[0]) - w // 2)
+        y = int(pos[1]) - (int(center_pos[1]) - h // 2)
+        return 0 <= x < w and 0 <= y < h and bool(mask.get_at((x, y)))
+
+    @property
+    def is_finished(self) -> bool:
+        return self.finished
+
+    @property
+    def is_target(self) -> bool:
+        """ Zombie is up and can still be whacked """
+        return self.state == "idle" and self.respawn_timer <= 0 and not self.hit
+
+
+class GameSession:
+    """ One round of Whack-a-Zombie driven by clicks and dt
+
+    The only implementation of the rules: the server runs one per client
+    and `whack_a_zombie.main()` runs one per round, passing in its drawn
+    `Zombies` (a ZombieState) as `zombie`. Every state change is appended
+    to `events` as a plain dict so callers can forward it or react to it.
+    """
+    def __init__(self, difficulty: int = 0, time_limit: float = GAME_TIME,
+                 seed: Optional[int] = None, size: Tuple[int, int] = SCREEN_SIZE,
+                 zombie: Optional[ZombieState] = None):
+        if not 0 <= difficulty < len(NUM_SPAWNS):
+            raise ValueError(f"Unexpected difficulty: {difficulty}")
+        self.difficulty = difficulty
+        self.time_limit = time_limit
+        self.rng = random.Random(seed)
+
+        grid = holes_grid(NUM_SPAWNS[difficulty], size)
+        self.holes_positions = [pos for row in grid for pos in row]
+        self.holes_center = [center_pos(pos) for pos in self.holes_positions]
+
+        # Masks are built once per process and shared by every session
+        if zombie is None:
+            masks = zombie_masks()
+            zombie = ZombieState(len(masks[0]), len(masks[1]),
+                                 idle_fps=10, death_fps=12, masks=masks)
+        self.zombie = zombie
+
+        self.score = 0
+        self.hits = 0
+        self.misses = 0
+        self.clicks = 0
+        self.elapsed = 0.0
+        self.playing = False
+        self.finished = False
+        self.current_pos: Optional[Tuple[float, float]] = None
+        self.spawn_id = 0
+        self.events: List[Dict] = []
+
+    # --- Controls ---
+    def start(self):
+        """ Start (or restart) the round """
+        self.score = self.hits = self.misses = self.clicks = 0
+        self.elapsed = 0.0
+        self.playing = True
+        self.finished = False
+        self.events.append({"event": "start", "time_limit": self.time_limit})
+        self.spawn()
+
+    def spawn(self):
+        """ Move the zombie to a random hole """
+        self.current_pos = self.rng.choice(self.holes_center)
+        self.zombie.play_idle()
+        self.zombie.reset()
+        self.spawn_id += 1
+        self.events.append({"event": "spawn", "id": self.spawn_id, "pos": self.current_pos})
+
+    def click(self, pos: Tuple[float, float]) -> bool:
+        """ Validate a click; returns True when it scored a hit """
+        if not self.playing:
+            return False
+        self.clicks += 1
+        if self.current_pos is not None and self.zombie.hit_test(pos, self.current_pos):
+            if self.zombie.state != "death" and not self.zombie.hit:
+                self.zombie.play_death()
+                self.zombie.hit = True
+                self.score += SCORE_PER_HIT
+                self.hits += 1
+                self.events.append({"event": "hit", "id": self.spawn_id, "score": self.score})
+                return True
+            return False
+        self.events.append({"event": "miss", "pos": tuple(pos)})
+        return False
+
+    def tick(self, dt: float):
+        """ Advance the round by dt seconds """
+        # Update game timer
+        if self.playing:
+            self.elapsed += dt
+            if self.elapsed >= self.time_limit:
+                self.playing = False
+                self.finished = True
+                self.events.append({"event": "end", **self.result()})
+
+        # Random Zombie
+        zombie = self.zombie
+        zombie.update(dt)
+        if zombie.state == "idle" and zombie.respawn_timer <= 0:
+            zombie.stay_timer -= dt
+            if zombie.stay_timer <= 0 and self.playing:
+                self.misses += 1
+                self.events.append({"event": "escaped", "id": self.spawn_id, "misses": self.misses})
+                self.spawn()
+        if zombie.is_finished and zombie.linger <= 0:
+            zombie.respawn_timer += dt
+            if zombie.respawn_timer >= zombie.respawn_delay:
+                self.spawn()
+
+    def drain_events(self) -> List[Dict]:
+        events, self.events = self.events, []
+        return events
+
+    def result(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "difficulty": self.difficulty,
+            "score": self.score,
+            "hits": self.hits,
+            "misses": self.misses,
+            "clicks": self.clicks,
+            "accuracy": (self.hits / total * 100) if total else 0.0,
+        }
@@ -0,0 +1,168 @@
+from pathlib import Path
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+DB_PATH = Path(__file__).resolve().parent.parent / "data" / "scores.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id          INTEGER PRIMARY KEY,
+    difficulty  INTEGER NOT NULL,
+    score       INTEGER NOT NULL,
+    hits        INTEGER NOT NULL,
+    misses      INTEGER NOT NULL,
+    created_at  REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_difficulty_score
+    ON scores (difficulty, score DESC, created_at);
+"""
+
+TOP_QUERY = """
+SELECT score, hits, misses, created_at FROM scores
+WHERE difficulty = ?
+ORDER BY score DESC, created_at ASC
+LIMIT ?
+"""
+
+Entry = Tuple[int, int, int, float]     # (score, hits, misses, created_at)
+
+
+class Leaderboard:
+    """ High-score store backed by a local SQLite file
+
+    All database work happens on a single writer thread so the game loop
+    never waits on disk: `submit` only enqueues, and `top` returns whatever
+    is cached (refreshing it in the background when it is stale).
+    """
+    def __init__(self, path: Optional[Path] = DB_PATH, top_k: int = 5,
+                 batch_size: int = 256):
+        self.path = Path(path) if path is not None else None
+        self.top_k = top_k
+        self.batch_size = batch_size
+
+        # Cache of top-K results per difficulty, filled by the writer thread
+        self._cache: Dict[Tuple[int, int], List[Entry]] = {}
+        self._stale: set = set()
+        self._lock = threading.Lock()
+
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    # --- Public API (safe to call from the game loop) ---
+    def submit(self, difficulty: int, score: int, hits: int, misses: int) -> float:
+        """ Queue a finished game for writing; returns its `created_at` to find it in `top` """
+        created_at = time.time()
+        self._jobs.put(("insert", (difficulty, score, hits, misses, created_at)))
+        return created_at
+
+    def top(self, difficulty: int, k: Optional[int] = None) -> List[Entry]:
+        """ Cached top-K for a difficulty; never touches the database """
+        key = (difficulty, k or self.top_k)
+        with self._lock:
+            entries = self._cache.get(key)
+            if entries is not None and key not in self._stale:
+                return entries
+            if key not in self._stale:
+                self._stale.add(key)
+                self._jobs.put(("refresh", key))
+        return entries or []
+
+    def flush(self, timeout: Optional[float] = None):
+        """ Block until every queued job has been handled """
+        done = threading.Event()
+        self._jobs.put(("flush", done))
+        done.wait(timeout)
+
+    def count(self) -> int:
+        """ Number of stored games (blocking; meant for tools and benchmarks) """
+        result: list = []
+        done = threading.Event()
+        self._jobs.put(("count", (result, done)))
+        done.wait()
+        return result[0]
+
+    def close(self):
+        if self._thread.is_alive():
+            self._jobs.put(("close", None))
+            self._thread.join()
+
+    # --- Writer thread ---
+    def _connect(self) -> sqlite3.Connection:
+        if self.path is None:
+            conn = sqlite3.connect(":memory:")
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _run(self):
+        try:
+            conn = self._connect()
+        except (sqlite3.Error, OSError) as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+
+        running = True
+        while running:
+            jobs = [self._jobs.get()]
+            # Drain whatever else is waiting so inserts share one transaction
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [arg for op, arg in jobs if op == "insert"]
+            if rows:
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT INTO scores (difficulty, score, hits, misses, created_at)"
+                            " VALUES (?, ?, ?, ?, ?)", rows)
+                except sqlite3.Error as e:
+                    print(f"[Leaderboard] Warning: failed to save scores: {e}")
+                self._invalidate({row[0] for row in rows})
+
+            for op, arg in jobs:
+                if op == "refresh":
+                    self._refresh(conn, arg)
+                elif op == "count":
+                    result, done = arg
+                    result.append(conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0])
+                    done.set()
+                elif op == "flush":
+                    arg.set()
+                elif op == "close":
+                    running = False
+        conn.close()
+
+    def _invalidate(self, difficulties):
+        with self._lock:
+            for key in list(self._cache):
+                if key[0] in difficulties and key not in self._stale:
+                    self._stale.add(key)
+                    self._jobs.put(("refresh", key))
+
+    def _refresh(self, conn: sqlite3.Connection, key: Tuple[int, int]):
+        try:
+            entries = [tuple(row) for row in conn.execute(TOP_QUERY, key)]
+        except sqlite3.Error as e:
+            print(f"[Leaderboard] Warning: failed to read scores: {e}")
+            entries = []
+        with self._lock:
+            self._cache[key] = entries
+            self._stale.discard(key)
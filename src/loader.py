@@ -0,0 +1,89 @@
+# src/loader.py
+""" Background asset loading
+
+Image and sound files are read and decoded on a thread pool. Finished
+results are handed to the resource manager from the main thread in
+`pump()`, and `convert`/`convert_alpha` still happen on the main thread
+the first time a class asks RESOURCES for the image.
+
+Files are submitted in named groups so the game can show the menu as soon
+as the "menu" group is in, while the rest keeps streaming.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+from pathlib import Path
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+import pygame as pg
+try:
+    from .resources import RESOURCES, ResourceManager
+except ImportError:
+    from resources import RESOURCES, ResourceManager
+
+
+def decode_image(path: Path) -> pg.Surface:
+    return pg.image.load(str(path))
+
+def decode_sound(path: Path) -> pg.mixer.Sound:
+    return pg.mixer.Sound(str(path))
+
+
+class AssetLoader:
+    def __init__(self, resources: ResourceManager = RESOURCES, workers: Optional[int] = None):
+        self.resources = resources
+        self.pool = ThreadPoolExecutor(max_workers=workers or min(8, (os.cpu_count() or 1) + 2),
+                                       thread_name_prefix="asset-loader")
+        self.groups: Dict[str, List[Tuple[str, Path, Future]]] = {}
+        self.t0 = time.perf_counter()
+        self.marks: Dict[str, float] = {}       # milestone -> seconds since the loader started
+        self.failed = 0
+
+    def submit(self, group: str, images: Iterable = (), sounds: Iterable = ()):
+        jobs = self.groups.setdefault(group, [])
+        for path in images:
+            path = self.resources.path(path)
+            jobs.append(("image", path, self.pool.submit(decode_image, path)))
+        for path in sounds:
+            path = self.resources.path(path)
+            jobs.append(("sound", path, self.pool.submit(decode_sound, path)))
+
+    def pump(self):
+        """ Hand finished decodes to the resource manager (main thread only) """
+        for jobs in self.groups.values():
+            remaining = []
+            for kind, path, future in jobs:
+                if not future.done():
+                    remaining.append((kind, path, future))
+                    continue
+                try:
+                    self.resources.add_decoded(kind, path, future.result())
+                except (pg.error, OSError) as e:
+                    # The owner will load it again synchronously and report the error there
+                    self.failed += 1
+                    print(f"[Loader] Warning: could not preload {path}: {e}")
+            jobs[:] = remaining
+
+    def done(self, group: str) -> bool:
+        self.pump()
+        return not self.groups.get(group)
+
+    def wait(self, group: str):
+        """ Block until a group is in """
+        for _, _, future in list(self.groups.get(group, [])):
+            try:
+                future.result()
+            except (pg.error, OSError):
+                pass
+        self.pump()
+
+    def mark(self, name: str) -> float:
+        """ Record a milestone (e.g. first frame) and print it """
+        elapsed = time.perf_counter() - self.t0
+        self.marks[name] = elapsed
+        print(f"[Loader] {name}: {elapsed * 1000:.1f} ms")
+        return elapsed
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        # Anything decoded but never asked for would otherwise sit outside any owner
+        self.resources.drop_decoded()
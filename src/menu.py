@@ -1,9 +1,13 @@
 import os
 from pathlib import Path
 import pygame as pg
+try:
+    from .resources import RESOURCES
+except ImportError:
+    from resources import RESOURCES
 
 ASSETS = Path(__file__).resolve().parent.parent / "assets" / "images" / "menu"
-FONT = Path(__file__).resolve().parent.parent / "assets" / "fonts"
+FONT = Path(__file__).resolve().parent.parent / "assets" / "Fonts"
 
 class Menu:
     def __init__(self, screen: pg.Surface, font_size: int = 36):
@@ -15,8 +19,8 @@ class Menu:
         font_path = FONT / "Pixellari.ttf"
 
         try:
-            self.large_font = pg.font.Font(font_path, font_size * 3)  # Larger font for title
-            self.font = pg.font.Font(font_path, font_size)
+            self.large_font = RESOURCES.font(font_path, font_size * 3)  # Larger font for title
+            self.font = RESOURCES.font(font_path, font_size)
         except FileNotFoundError:
             # Fallback to system font if file not found
             self.large_font = pg.font.SysFont(None, font_size * 2)
@@ -26,33 +30,41 @@ class Menu:
         self.title_color = (255, 255, 255)
         self.lv_color = (127, 127, 127)
 
-        self.start_btn = pg.image.load(ASSETS / "Play_Not-Pressed.png").convert()
-        self.quit_btn = pg.image.load(ASSETS / "Quit_Not-Pressed.png").convert()
-        self.arrow_l = pg.image.load(ASSETS / "arrow_left.png").convert()
-        self.arrow_r = pg.image.load(ASSETS / "arrow_right.png").convert()
-
         btn_size = (76 * 3, 21 * 3)
         arrow_size = (7 * 5, 11 * 5)
 
-        # Buttons
-        self.start_btn = pg.transform.scale(self.start_btn, btn_size)
+        # Buttons (scaled once by the shared cache)
+        self.start_btn = RESOURCES.image(ASSETS / "Play_Not-Pressed.png", btn_size, alpha=False)
         self.start_btn_rect = self.start_btn.get_rect()
-        self.quit_btn = pg.transform.scale(self.quit_btn, btn_size)
+        self.quit_btn = RESOURCES.image(ASSETS / "Quit_Not-Pressed.png", btn_size, alpha=False)
         self.quit_btn_rect = self.quit_btn.get_rect()
 
         # L and R arrows
-        self.arrow_l = pg.transform.scale(self.arrow_l, arrow_size)
+        self.arrow_l = RESOURCES.image(ASSETS / "arrow_left.png", arrow_size, alpha=False)
         self.l_rect = self.arrow_l.get_rect()
 
-        self.arrow_r = pg.transform.scale(self.arrow_r, arrow_size)
+        self.arrow_r = RESOURCES.image(ASSETS / "arrow_right.png", arrow_size, alpha=False)
         self.r_rect = self.arrow_r.get_rect()
 
+        # Dims the game behind the menu; an opaque surface with per-surface alpha
+        # blends much faster than a SRCALPHA one
+        self.use_overlay = True
+        self.overlay = pg.Surface((self.width, self.height)).convert()
+        self.overlay.fill((0, 0, 0))
+        self.overlay.set_alpha(127)
+
         # Hover states
         self.start_hover = False
         self.quit_hover = False
         self.l_hover = False
         self.r_hover = False
 
+    @staticmethod
+    def asset_paths():
+        """ Image files loaded by __init__, for the background loader """
+        names = ["Play_Not-Pressed.png", "Quit_Not-Pressed.png", "arrow_left.png", "arrow_right.png"]
+        return [ASSETS / n for n in names]
+
     def handle_events(self, event) -> str:
         if event.type == pg.MOUSEMOTION:
             # Check if mouse is hovering over buttons
@@ -75,11 +87,10 @@ class Menu:
                 return "quit"
         return None
 
-    def draw(self, curr_diff = 0):
+    def draw(self, curr_diff = 0, loading = False):
         # Semi-transparent overlay
-        overlay = pg.Surface((self.width, self.height), pg.SRCALPHA)
-        overlay.fill((0, 0, 0, 127))  # Black with 70% opacity
-        self.screen.blit(overlay, (0, 0))
+        if self.use_overlay:
+            self.screen.blit(self.overlay, (0, 0))
 
         # Draw game title
         title_text = self.large_font.render("WHACK-A-ZOMBIE", False, self.title_color)
@@ -87,9 +98,13 @@ class Menu:
         title_rect.center = (self.width / 2, self.height / 4)
         self.screen.blit(title_text, title_rect)
 
-        # Draw start button
+        # Draw start button (a "Loading..." label until the game assets are in)
         self.start_btn_rect.center = (self.width / 2, self.height / 2)
-        self.screen.blit(self.start_btn, self.start_btn_rect)
+        if loading:
+            loading_text = self.font.render("Loading...", False, self.lv_color)
+            self.screen.blit(loading_text, loading_text.get_rect(center=self.start_btn_rect.center))
+        else:
+            self.screen.blit(self.start_btn, self.start_btn_rect)
 
         # Draw L and R arrows
         self.l_rect.center = (self.width / 3, self.height / 3 * 2)
@@ -0,0 +1,157 @@
+# src/pacing.py
+""" Frame pacing
+
+`FramePacer.wait()` ends every frame by waiting for the next one to be
+due, and measures the real interval with `time.perf_counter` (pygame's
+Clock only reports whole milliseconds). Strategies, cheapest first:
+
+  vsync   don't wait at all; the flip already waits for the display
+          (only when the renderer got a vsync'd window, see renderer.py)
+  sleep   time.sleep until the deadline, accurate to the OS timer
+  hybrid  sleep until `spin_ms` before the deadline, then spin
+  busy    pygame's Clock.tick_busy_loop (spins the whole wait)
+
+WAZ_PACING=<strategy> pins one; by default (auto) each available
+strategy is tried for a moment and the cheapest one whose jitter is
+within `tolerance_ms` of the best is kept.
+
+Jitter is the deviation of each interval from the target period (RMS,
+stddev and max); an interval that spans more than one and a half periods
+counts its extra periods as dropped frames.
+"""
+from collections import deque
+import math
+import os
+import statistics
+import time
+from typing import Deque, Dict, List, Optional
+import pygame as pg
+
+STRATEGIES = ("vsync", "sleep", "hybrid", "busy")   # cheapest first
+MAX_DT = 0.1    # longer stalls (window drag, breakpoints) don't teleport the timers
+
+
+class FramePacer:
+    def __init__(self, fps: float = 60.0, strategy: Optional[str] = None, vsync: bool = False,
+                 spin_ms: float = 2.0, window: int = 300, trial_frames: int = 60,
+                 tolerance_ms: float = 0.25):
+        strategy = strategy or os.environ.get("WAZ_PACING", "auto")
+        self.fps = fps
+        self.period = 1.0 / fps
+        self.spin = spin_ms / 1000
+        self.tolerance_ms = tolerance_ms
+        self.candidates: List[str] = [s for s in STRATEGIES if s != "vsync" or vsync]
+        if strategy == "vsync" and not vsync:
+            print("Warning: vsync pacing needs a vsync'd display (WAZ_DISPLAY=sdl WAZ_VSYNC=1), "
+                  "picking a strategy automatically")
+            strategy = "auto"
+        elif strategy != "auto" and strategy not in STRATEGIES:
+            print(f"Warning: unknown pacing strategy '{strategy}', expected auto or one of {STRATEGIES}")
+            strategy = "auto"
+
+        # Auto: try each candidate for `trial_frames`, then keep the best
+        self.auto = strategy == "auto"
+        self.strategy = self.candidates[0] if self.auto else strategy
+        self.trial_frames = trial_frames
+        self.trial: List[float] = []
+        self.trials: Dict[str, Dict] = {}
+
+        self.clock = pg.time.Clock()
+        self.intervals: Deque[float] = deque(maxlen=window)
+        self.frames = 0
+        self.dropped = 0
+        self.last = time.perf_counter()
+        self.deadline = self.last + self.period
+        self.dt = self.period
+
+    @property
+    def present_waits(self) -> bool:
+        """ True when the flip blocks on the display, so it isn't frame work """
+        return self.strategy == "vsync"
+
+    def wait(self) -> float:
+        """ Block until the next frame is due; returns its dt in seconds """
+        if self.strategy == "sleep":
+            self.sleep_until(self.deadline)
+        elif self.strategy == "hybrid":
+            self.sleep_until(self.deadline - self.spin)
+            while time.perf_counter() < self.deadline:
+                time.sleep(0)       # give the GIL to the loader / leaderboard threads
+        elif self.strategy == "busy":
+            self.clock.tick_busy_loop(self.fps)
+
+        now = time.perf_counter()
+        interval = now - self.last
+        self.last = now
+        self.deadline += self.period
+        if self.deadline < now:
+            # More than a frame behind: start over from now instead of rushing to catch up
+            self.deadline = now + self.period
+
+        self.frames += 1
+        self.intervals.append(interval)
+        self.dropped += max(0, round(interval / self.period) - 1)
+        if self.auto:
+            self.next_trial(interval)
+        self.dt = min(interval, MAX_DT)
+        return self.dt
+
+    def sleep_until(self, deadline: float):
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    # --- Auto selection ---
+    def next_trial(self, interval: float):
+        self.trial.append(interval)
+        if len(self.trial) < self.trial_frames:
+            return
+        # The first few frames of a trial still carry the previous strategy's schedule
+        self.trials[self.strategy] = jitter(self.trial[5:], self.period)
+        self.trial = []
+        remaining = [s for s in self.candidates if s not in self.trials]
+        if remaining:
+            self.switch(remaining[0])
+            return
+
+        best = min(t["rms_ms"] for t in self.trials.values())
+        self.switch(next(s for s in self.candidates
+                         if self.trials[s]["rms_ms"] <= best + self.tolerance_ms))
+        self.auto = False
+        self.intervals.clear()
+        summary = ", ".join(f"{s} {t['rms_ms']:.2f}" for s, t in self.trials.items())
+        print(f"[Pacing] Using {self.strategy} (RMS jitter ms: {summary})")
+
+    def switch(self, strategy: str):
+        """ Change strategy, restarting the schedule from the current frame """
+        self.strategy = strategy
+        self.deadline = self.last + self.period     # busy pacing keeps its own (ms) schedule
+        self.clock.tick()
+
+    # --- Stats ---
+    @property
+    def current_fps(self) -> float:
+        if not self.intervals:
+            return 0.0
+        return len(self.intervals) / sum(self.intervals)
+
+    def stats(self) -> Dict:
+        return {
+            "strategy": self.strategy,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            **jitter(list(self.intervals), self.period),
+        }
+
+
+def jitter(intervals: List[float], period: float) -> Dict:
+    """ Deviation of frame intervals from the target period, in ms """
+    if len(intervals) < 2:
+        return {"mean_ms": 0.0, "stddev_ms": 0.0, "rms_ms": 0.0, "max_dev_ms": 0.0}
+    deviations = [(i - period) * 1000 for i in intervals]
+    return {
+        "mean_ms": statistics.fmean(intervals) * 1000,
+        "stddev_ms": statistics.stdev(intervals) * 1000,
+        "rms_ms": math.sqrt(statistics.fmean(d * d for d in deviations)),
+        "max_dev_ms": max(abs(d) for d in deviations),
+    }
@@ -0,0 +1,139 @@
+# src/particles.py
+""" Hit and miss particle effects
+
+Every particle lives in a fixed-capacity pool of NumPy arrays allocated
+up front; a frame is one batched update of the live slots plus a single
+`Surface.blits` call with sprites pre-rendered per kind and fade level.
+When the pool is full new particles are dropped, never allocated.
+"""
+from typing import Dict, List, Tuple
+import numpy as np
+import pygame as pg
+
+
+COLORKEY = (255, 0, 255)
+
+
+class ParticleKind:
+    def __init__(self, colors: List[Tuple[int, int, int]], radius: int,
+                 speed: Tuple[float, float], life: Tuple[float, float],
+                 gravity: float, drag: float, lift: float = 0.0):
+        self.colors = colors        # one sprite set per color
+        self.radius = radius
+        self.speed = speed          # (min, max) px/s
+        self.life = life            # (min, max) seconds
+        self.gravity = gravity      # px/s^2, positive is down
+        self.drag = drag            # fraction of velocity kept per second
+        self.lift = lift            # initial upward bias, px/s
+
+KINDS: Dict[str, ParticleKind] = {
+    "splatter": ParticleKind([(120, 180, 40), (90, 140, 30), (160, 30, 30)], radius=3,
+                             speed=(120, 420), life=(0.35, 0.8), gravity=900, drag=0.08, lift=160),
+    "dust":     ParticleKind([(150, 130, 100), (120, 105, 85)], radius=2,
+                             speed=(30, 140), life=(0.25, 0.6), gravity=-40, drag=0.2),
+}
+
+
+class ParticleSystem:
+    def __init__(self, screen: pg.Surface, capacity: int = 20000,
+                 fade_steps: int = 6, seed=None):
+        self.screen = screen
+        self.capacity = capacity
+        self.fade_steps = fade_steps
+        self.rng = np.random.default_rng(seed)
+        self.emit_scale = 1.0       # quality setting: share of requested particles emitted
+
+        # Pool
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.max_life = np.ones(capacity, np.float32)
+        self.sprite = np.zeros(capacity, np.int32)     # first sprite index of the particle's set
+        self.gravity = np.zeros(capacity, np.float32)
+        self.drag = np.ones(capacity, np.float32)
+        self.alive = np.zeros(capacity, bool)
+        self.dropped = 0
+
+        # Sprites: for each (kind, color) a run of `fade_steps` images, faintest first
+        self.sprites: List[pg.Surface] = []
+        self.kind_sprites: Dict[str, List[int]] = {}
+        self.offset: List[int] = []                    # half size per sprite, to center it
+        for name, kind in KINDS.items():
+            starts = []
+            for color in kind.colors:
+                starts.append(len(self.sprites))
+                for step in range(fade_steps):
+                    alpha = int(255 * (step + 1) / fade_steps)
+                    size = kind.radius * 2
+                    # Colorkey + surface alpha with RLE blits far faster than per-pixel alpha
+                    img = pg.Surface((size, size)).convert()
+                    img.fill(COLORKEY)
+                    pg.draw.circle(img, color, (kind.radius, kind.radius), kind.radius)
+                    img.set_colorkey(COLORKEY, pg.RLEACCEL)
+                    img.set_alpha(alpha, pg.RLEACCEL)
+                    self.sprites.append(img)
+                    self.offset.append(kind.radius)
+            self.kind_sprites[name] = starts
+        self.offset_arr = np.array(self.offset, np.float32)
+
+    @property
+    def count(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def emit(self, name: str, pos: Tuple[float, float], count: int):
+        """ Spawn up to `count` particles of a kind at `pos` """
+        kind = KINDS[name]
+        count = int(count * self.emit_scale)
+        free = np.flatnonzero(~self.alive)[:count]
+        self.dropped += count - len(free)
+        n = len(free)
+        if n == 0:
+            return
+
+        rng = self.rng
+        angle = rng.uniform(0, 2 * np.pi, n)
+        speed = rng.uniform(*kind.speed, n)
+        self.pos[free] = pos
+        self.vel[free, 0] = np.cos(angle) * speed
+        self.vel[free, 1] = np.sin(angle) * speed - kind.lift
+        life = rng.uniform(*kind.life, n)
+        self.life[free] = life
+        self.max_life[free] = life
+        self.sprite[free] = rng.choice(self.kind_sprites[name], n)
+        self.gravity[free] = kind.gravity
+        self.drag[free] = kind.drag
+        self.alive[free] = True
+
+    def splatter(self, pos: Tuple[float, float], count: int = 40):
+        self.emit("splatter", pos, count)
+
+    def dust(self, pos: Tuple[float, float], count: int = 16):
+        self.emit("dust", pos, count)
+
+    def update(self, dt: float):
+        """ Advance every live particle in one batched step """
+        idx = np.flatnonzero(self.alive)
+        if len(idx) == 0:
+            return
+        vel = self.vel[idx]
+        vel *= (self.drag[idx] ** dt)[:, None]
+        vel[:, 1] += self.gravity[idx] * dt
+        self.vel[idx] = vel
+        self.pos[idx] += vel * dt
+        life = self.life[idx] - dt
+        self.life[idx] = life
+        self.alive[idx[life <= 0]] = False
+
+    def draw(self):
+        idx = np.flatnonzero(self.alive)
+        if len(idx) == 0:
+            return
+        fade = (self.life[idx] / self.max_life[idx] * self.fade_steps).astype(np.int32)
+        sprite = self.sprite[idx] + np.clip(fade, 0, self.fade_steps - 1)
+        dest = (self.pos[idx] - self.offset_arr[sprite][:, None]).astype(np.int32)
+        # zip/map build the (sprite, dest) pairs in C; a Python loop here cost more than the blits
+        self.screen.blits(zip(map(self.sprites.__getitem__, sprite.tolist()), dest.tolist()),
+                          doreturn=False)
+
+    def clear(self):
+        self.alive[:] = False
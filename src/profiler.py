@@ -0,0 +1,195 @@
+# src/profiler.py
+""" Sampling profiler
+
+A background thread looks at the main thread's stack every few
+milliseconds (`sys._current_frames`) and counts identical stacks. Nothing
+is hooked into the game loop itself, so frame times stay representative,
+unlike running the game under cProfile.
+
+Profiles are written in collapsed-stack format (`root;child;leaf count`
+per line), which flamegraph.pl, speedscope and inferno read directly.
+
+  F10 / WAZ_PROFILE=1       record until toggled off (or quit), then
+                            write profiles/<timestamp>.folded
+  WAZ_PROFILE_SPIKE_MS=<ms> keep the last `window_s` seconds of samples
+                            and write the slow frame's share of them to
+                            profiles/spike-<timestamp>-<ms>ms.folded
+                            whenever a frame takes longer than that
+  WAZ_PROFILE_INTERVAL_MS   time between samples (default 5)
+
+Files are written by the sampler thread, never the game loop. Names that
+are already taken (two dumps in one second) get a -2, -3, ... suffix.
+"""
+from collections import Counter, deque
+import itertools
+import math
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Deque, Dict, List, Optional, Tuple
+
+PROFILES = Path(__file__).resolve().parent.parent / "profiles"
+
+Stack = Tuple[CodeType, ...]    # root first
+
+
+class SamplingProfiler:
+    def __init__(self, interval_ms: Optional[float] = None, spike_ms: Optional[float] = None,
+                 window_s: float = 1.0, cooldown_s: float = 5.0,
+                 out_dir: Optional[Path] = None, thread_id: Optional[int] = None):
+        if interval_ms is None:
+            interval_ms = float(os.environ.get("WAZ_PROFILE_INTERVAL_MS", "5"))
+        if spike_ms is None and os.environ.get("WAZ_PROFILE_SPIKE_MS"):
+            spike_ms = float(os.environ["WAZ_PROFILE_SPIKE_MS"])
+        self.interval = interval_ms / 1000
+        self.spike_ms = spike_ms
+        self.window = window_s
+        self.cooldown = cooldown_s
+        self.out_dir = Path(out_dir or PROFILES)
+        self.thread_id = thread_id or threading.main_thread().ident
+
+        self.recording: Optional[Counter] = None            # manual capture
+        self.recent: Deque[Tuple[float, Stack]] = deque()   # for spike captures
+        self.dumps: List[Tuple[Counter, str]] = []          # spikes waiting to be written
+        self.labels: Dict[CodeType, str] = {}
+        self.last_spike = -math.inf
+        self.samples = 0
+        self.spikes = 0
+
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopped = False
+        self.thread = threading.Thread(target=self.run, name="profiler", daemon=True)
+        self.thread.start()
+
+        if os.environ.get("WAZ_PROFILE") == "1":
+            self.start()
+
+    @property
+    def sampling(self) -> bool:
+        return self.recording is not None or self.spike_ms is not None
+
+    # --- Sampler thread ---
+    def run(self):
+        while not self.stopped:
+            self.write_dumps()
+            if not self.sampling:
+                self.wake.wait()
+                self.wake.clear()
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                stack = self.stack(frame)
+                del frame
+                now = time.perf_counter()
+                with self.lock:
+                    self.samples += 1
+                    if self.recording is not None:
+                        self.recording[stack] += 1
+                    if self.spike_ms is not None:
+                        self.recent.append((now, stack))
+                        while self.recent[0][0] < now - self.window:
+                            self.recent.popleft()
+            time.sleep(self.interval)
+        self.write_dumps()
+
+    def write_dumps(self):
+        if not self.dumps:
+            return
+        with self.lock:
+            dumps, self.dumps = self.dumps, []
+        for counts, name in dumps:
+            self.write(counts, name)
+
+    def stack(self, frame: Optional[FrameType]) -> Stack:
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return tuple(codes)
+
+    # --- Controls (main thread) ---
+    def start(self):
+        """ Start a manual recording """
+        with self.lock:
+            if self.recording is None:
+                self.recording = Counter()
+        self.wake.set()
+        print("[Profiler] Recording")
+
+    def stop(self):
+        """ Stop a manual recording; the sampler thread writes it """
+        with self.lock:
+            counts, self.recording = self.recording, None
+            if counts is None:
+                return
+            self.dumps.append((counts, time.strftime("%Y%m%d-%H%M%S")))
+        self.wake.set()
+
+    def toggle(self):
+        if self.recording is None:
+            self.start()
+        else:
+            self.stop()
+
+    def frame_done(self, frame_ms: float):
+        """ Call once per frame; when the frame was a spike, the samples taken
+        during it (plus a couple of intervals of slack) are written by the
+        sampler thread """
+        if self.spike_ms is None or frame_ms <= self.spike_ms:
+            return
+        now = time.perf_counter()
+        if now - self.last_spike < self.cooldown:
+            return
+        self.last_spike = now
+        self.spikes += 1
+        since = now - frame_ms / 1000 - 2 * self.interval
+        with self.lock:
+            counts = Counter(stack for t, stack in self.recent if t >= since)
+            self.dumps.append((counts, f"spike-{time.strftime('%Y%m%d-%H%M%S')}-{frame_ms:.0f}ms"))
+
+    def close(self):
+        self.stop()
+        self.stopped = True
+        self.wake.set()
+        self.thread.join(timeout=10.0)  # let it write what's still queued
+
+    # --- Output ---
+    def label(self, code: CodeType) -> str:
+        label = self.labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+            self.labels[code] = label
+        return label
+
+    def collapsed(self, counts: Counter) -> str:
+        """ One `frame;frame;frame count` line per distinct stack """
+        lines = [";".join(self.label(c) for c in stack) + f" {n}"
+                 for stack, n in counts.most_common()]
+        return "\n".join(lines) + "\n"
+
+    def write(self, counts: Counter, name: str) -> Optional[Path]:
+        if not counts:
+            print("[Profiler] No samples recorded")
+            return None
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            text = self.collapsed(counts)
+            # Names are per second: a second dump in the same second gets a suffix
+            for n in itertools.count(1):
+                path = self.out_dir / (f"{name}.folded" if n == 1 else f"{name}-{n}.folded")
+                try:
+                    with open(path, "x") as f:
+                        f.write(text)
+                    break
+                except FileExistsError:
+                    continue
+        except OSError as e:
+            print(f"[Profiler] Warning: could not write profile: {e}")
+            return None
+        print(f"[Profiler] {sum(counts.values())} samples -> {path}")
+        return path
@@ -0,0 +1,116 @@
+# src/quality.py
+""" Adaptive quality governor
+
+Watches a rolling window of frame work times (everything up to the flip,
+not the time spent waiting for the next frame, see pacing.py) and steps
+through quality tiers to keep the frame inside the budget for the target FPS.
+
+A tier that blew the budget waits twice as long before it is tried again
+(up to `max_up_cooldown`), so a tier that simply costs too much is not
+re-entered every few seconds; holding a tier for `forgive` seconds
+clears its record.
+"""
+from collections import deque
+import math
+import os
+import statistics
+import time
+from typing import Deque, List, Optional, Tuple
+
+
+class QualityTier:
+    def __init__(self, name: str, overlay_alpha: bool, text_aa: bool,
+                 bar_radius: int, anim_stride: int, particles: float):
+        self.name = name
+        self.overlay_alpha = overlay_alpha  # dim the game behind menu / replay board
+        self.text_aa = text_aa              # anti-aliased ScoreBoard text
+        self.bar_radius = bar_radius        # border radius of the zombie timer bar
+        self.anim_stride = anim_stride      # show every n-th animation frame
+        self.particles = particles          # share of hit/miss particles emitted
+
+# Best first. The background isn't a tier setting: it is pre-rendered once
+# (background.py), so leaving out the grass would only change how it looks.
+TIERS: List[QualityTier] = [
+    QualityTier("high",    overlay_alpha=True,  text_aa=True,  bar_radius=4, anim_stride=1, particles=1.0),
+    QualityTier("medium",  overlay_alpha=True,  text_aa=False, bar_radius=0, anim_stride=1, particles=1.0),
+    QualityTier("low",     overlay_alpha=True,  text_aa=False, bar_radius=0, anim_stride=2, particles=0.5),
+    QualityTier("minimal", overlay_alpha=False, text_aa=False, bar_radius=0, anim_stride=2, particles=0.25),
+]
+
+
+class QualityGovernor:
+    def __init__(self, target_fps: float = 60.0, window: int = 60,
+                 headroom: float = 0.6, down_cooldown: float = 1.0, up_cooldown: float = 5.0,
+                 max_up_cooldown: float = 300.0, forgive: float = 60.0,
+                 tier: Optional[str] = None):
+        self.budget_ms = 1000.0 / target_fps
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.headroom = headroom            # step up only when p90 is under this share of the budget
+        self.down_cooldown = down_cooldown
+        self.up_cooldown = up_cooldown
+        self.max_up_cooldown = max_up_cooldown
+        self.forgive = forgive
+        self.retry_after: List[float] = [up_cooldown] * len(TIERS)  # per tier: wait before stepping up into it
+
+        # WAZ_QUALITY=<tier name> pins the tier and disables adaptation
+        tier = tier or os.environ.get("WAZ_QUALITY")
+        names = [t.name for t in TIERS]
+        if tier is not None and tier not in names:
+            print(f"Warning: unknown quality tier '{tier}', expected one of {names}")
+            tier = None
+        self.pinned = tier is not None
+        self.index = names.index(tier) if tier else 0
+        self.last_change = -math.inf
+        self.transitions: List[Tuple[float, str, str, float]] = []   # (time, from, to, p90 ms)
+
+    @property
+    def tier(self) -> QualityTier:
+        return TIERS[self.index]
+
+    def update(self, frame_ms: float, now: Optional[float] = None) -> bool:
+        """ Record a frame; returns True when the tier changed """
+        self.samples.append(frame_ms)
+        if self.pinned or len(self.samples) < self.samples.maxlen:
+            return False
+
+        now = time.perf_counter() if now is None else now
+        p90 = statistics.quantiles(self.samples, n=10)[-1]
+        since = now - self.last_change
+        if since >= self.forgive:
+            self.retry_after[self.index] = self.up_cooldown
+        if p90 > self.budget_ms and self.index < len(TIERS) - 1 and since >= self.down_cooldown:
+            # This tier failed: back off before trying it again
+            self.retry_after[self.index] = min(self.retry_after[self.index] * 2, self.max_up_cooldown)
+            self.step(+1, p90, now)
+            return True
+        if (p90 < self.budget_ms * self.headroom and self.index > 0
+                and since >= self.retry_after[self.index - 1]):
+            self.step(-1, p90, now)
+            return True
+        return False
+
+    def step(self, direction: int, p90: float, now: float):
+        old = self.tier.name
+        self.index += direction
+        self.last_change = now
+        self.samples.clear()
+        self.transitions.append((now, old, self.tier.name, p90))
+        print(f"[Quality] {old} -> {self.tier.name} (p90 frame {p90:.2f} ms, budget {self.budget_ms:.2f} ms)")
+
+    def apply(self, menu, replay_board, scoreboard, zombie, particles):
+        """ Push the current tier's settings into the game objects """
+        tier = self.tier
+        menu.use_overlay = tier.overlay_alpha
+        replay_board.use_overlay = tier.overlay_alpha
+        scoreboard.antialias = tier.text_aa
+        zombie.bar_radius = tier.bar_radius
+        zombie.anim_stride = tier.anim_stride
+        particles.emit_scale = tier.particles
+
+    def stats(self) -> dict:
+        return {
+            "tier": self.tier.name,
+            "pinned": self.pinned,
+            "p90_ms": statistics.quantiles(self.samples, n=10)[-1] if len(self.samples) > 1 else None,
+            "transitions": list(self.transitions),
+        }
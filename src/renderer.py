@@ -0,0 +1,115 @@
+# src/renderer.py
+""" Logical-resolution rendering
+
+The game always draws to a fixed 1024x768 surface. How that surface
+reaches the screen is picked with WAZ_DISPLAY:
+
+  window    (default) a window of exactly the logical size, no scaling
+  sdl       pg.SCALED: SDL scales the logical surface on the GPU and
+            maps mouse positions back for us
+  software  a window of WAZ_OUTPUT_SIZE (e.g. 1920x1080, default: the
+            desktop) and one letterboxed scale of the finished frame
+
+WAZ_FULLSCREEN=1 goes fullscreen in the sdl and software modes.
+WAZ_VSYNC=1 asks for a vsync'd window in the sdl mode (SDL only offers it
+with pg.SCALED); `vsync` tells whether the driver granted it.
+"""
+import os
+from typing import Optional, Tuple
+import pygame as pg
+
+MODES = ("window", "sdl", "software")
+
+
+def parse_size(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    if not value:
+        return None
+    try:
+        w, h = value.lower().split("x")
+        return (int(w), int(h))
+    except ValueError:
+        print(f"Warning: invalid size '{value}', expected WIDTHxHEIGHT")
+        return None
+
+
+class Renderer:
+    def __init__(self, logical_size: Tuple[int, int], mode: Optional[str] = None,
+                 output_size: Optional[Tuple[int, int]] = None,
+                 fullscreen: Optional[bool] = None, vsync: Optional[bool] = None):
+        mode = mode or os.environ.get("WAZ_DISPLAY", "window")
+        if mode not in MODES:
+            print(f"Warning: unknown display mode '{mode}', expected one of {MODES}")
+            mode = "window"
+        if fullscreen is None:
+            fullscreen = os.environ.get("WAZ_FULLSCREEN") == "1"
+        output_size = output_size or parse_size(os.environ.get("WAZ_OUTPUT_SIZE"))
+        if vsync is None:
+            vsync = os.environ.get("WAZ_VSYNC") == "1"
+        if vsync and mode != "sdl":
+            print("Warning: WAZ_VSYNC needs WAZ_DISPLAY=sdl, continuing without vsync")
+            vsync = False
+
+        self.mode = mode
+        self.logical_size = logical_size
+        self.scale = 1.0
+        self.offset = (0, 0)
+        self.vsync = False
+        flags = pg.FULLSCREEN if fullscreen else 0
+
+        if mode == "software":
+            if output_size is None:
+                info = pg.display.Info()
+                output_size = (info.current_w, info.current_h)
+            self.window = pg.display.set_mode(output_size, flags)
+            self.window.fill((0, 0, 0))     # letterbox bars are never drawn over
+
+            # Largest rect with the logical aspect ratio that fits the window
+            lw, lh = logical_size
+            ow, oh = self.window.get_size()
+            self.scale = min(ow / lw, oh / lh)
+            size = (int(lw * self.scale), int(lh * self.scale))
+            self.offset = ((ow - size[0]) // 2, (oh - size[1]) // 2)
+            self.target = self.window.subsurface(pg.Rect(self.offset, size))
+            self.surface = pg.Surface(logical_size).convert(self.window)
+        else:
+            if mode == "sdl":
+                flags |= pg.SCALED
+            self.window = None
+            if vsync:
+                try:
+                    self.window = pg.display.set_mode(logical_size, flags, vsync=1)
+                    self.vsync = True
+                except pg.error as e:
+                    print(f"Warning: vsync unavailable ({e}), continuing without it")
+            if self.window is None:
+                self.window = pg.display.set_mode(logical_size, flags)
+            self.target = None
+            self.surface = self.window
+
+    @property
+    def output_size(self) -> Tuple[int, int]:
+        return self.window.get_size()
+
+    def present(self):
+        """ Show the finished frame """
+        if self.target is not None:
+            pg.transform.scale(self.surface, self.target.get_size(), self.target)
+        pg.display.flip()
+
+    def to_logical(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """ Window coordinates -> logical coordinates """
+        if self.target is None:
+            return pos
+        return (int((pos[0] - self.offset[0]) / self.scale),
+                int((pos[1] - self.offset[1]) / self.scale))
+
+    def mouse_pos(self) -> Tuple[int, int]:
+        return self.to_logical(pg.mouse.get_pos())
+
+    def map_event(self, event: pg.event.Event) -> pg.event.Event:
+        """ Mouse events with positions in logical coordinates """
+        if self.target is None or not hasattr(event, "pos"):
+            return event
+        attrs = dict(event.dict)
+        attrs["pos"] = self.to_logical(event.pos)
+        return pg.event.Event(event.type, attrs)
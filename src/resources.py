@@ -0,0 +1,232 @@
+# src/resources.py
+""" Shared resource manager
+
+Fonts, images and sounds are loaded once per key and handed out to every
+caller that asks for the same thing. Paths are resolved once against the
+assets folder (case-insensitively, so `assets/fonts` finds `assets/Fonts`).
+
+Each `image`/`font`/`sound` call takes a reference; `release` gives it back.
+Entries without references stay cached until the memory budget
+(WAZ_ASSET_BUDGET_MB, default 256) is exceeded, then the least recently
+used ones are evicted first. Files decoded ahead of time by loader.py
+count against the same budget and are the first to go, since they can
+simply be read again. Images are converted to the display format
+and scaled to the size they are drawn at exactly once; the frame is
+composed at the logical resolution (see renderer.py), so nothing is
+scaled again per frame.
+"""
+from collections import OrderedDict
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+import pygame as pg
+
+ASSETS = Path(__file__).resolve().parent.parent / "assets"
+
+PathLike = Union[str, Path]
+
+
+class Entry:
+    def __init__(self, kind: str, value: Any, nbytes: int):
+        self.kind = kind        # "image" | "font" | "sound"
+        self.value = value
+        self.nbytes = nbytes
+        self.refs = 0
+
+
+class ResourceManager:
+    def __init__(self, root: Path = ASSETS, budget_mb: Optional[float] = None):
+        if budget_mb is None:
+            budget_mb = float(os.environ.get("WAZ_ASSET_BUDGET_MB", "256"))
+        self.root = root
+        self.budget = int(budget_mb * 1024 * 1024)
+
+        self.entries: "OrderedDict[Tuple, Entry]" = OrderedDict()   # least recently used first
+        self.keys: Dict[int, Tuple] = {}        # id(value) -> key, for release()
+        self.paths: Dict[str, Path] = {}        # requested path -> resolved path
+        self.decoded: Dict[Tuple[str, str], Tuple[Any, int]] = {}  # files decoded ahead of time, see loader.py
+        self.loaded_bytes = 0
+        self.decoded_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.over_budget = False
+
+    # --- Paths ---
+    def path(self, path: PathLike) -> Path:
+        """ Resolve a path relative to the assets folder, tolerating case differences """
+        resolved = self.paths.get(str(path))
+        if resolved is not None:
+            return resolved
+
+        full = Path(path)
+        if not full.is_absolute():
+            full = self.root / full
+        if not full.exists():
+            full = self.match_case(full)
+        self.paths[str(path)] = full
+        return full
+
+    def match_case(self, path: Path) -> Path:
+        """ Walk down from the root matching each part case-insensitively """
+        current = Path(path.anchor)
+        for part in path.parts[1:]:
+            candidate = current / part
+            if not candidate.exists() and current.is_dir():
+                matches = [p for p in current.iterdir() if p.name.lower() == part.lower()]
+                if matches:
+                    candidate = matches[0]
+            current = candidate
+        return current
+
+    # --- Loading ---
+    def image(self, path: PathLike, size: Optional[Tuple[int, int]] = None,
+              alpha: bool = True) -> pg.Surface:
+        """ Display-format image, pre-scaled to `size` when given """
+        full = self.path(path)
+        key = ("image", str(full), tuple(size) if size else None, alpha)
+        entry = self.lookup(key)
+        if entry is None:
+            img = self.take_decoded("image", full)
+            if img is None:
+                img = pg.image.load(str(full))
+            img = img.convert_alpha() if alpha else img.convert()
+            if size and img.get_size() != key[2]:
+                img = pg.transform.scale(img, key[2])
+            entry = self.store(key, img, img.get_pitch() * img.get_height())
+        return self.acquire(entry)
+
+    def font(self, path: PathLike, size: int) -> pg.font.Font:
+        """ Font at a point size; raises FileNotFoundError so callers can fall back to SysFont """
+        full = self.path(path)
+        key = ("font", str(full), size)
+        entry = self.lookup(key)
+        if entry is None:
+            if not full.is_file():
+                raise FileNotFoundError(f"No font file at {full}")
+            entry = self.store(key, pg.font.Font(str(full), size), full.stat().st_size)
+        return self.acquire(entry)
+
+    def sound(self, path: PathLike) -> pg.mixer.Sound:
+        full = self.path(path)
+        key = ("sound", str(full))
+        entry = self.lookup(key)
+        if entry is None:
+            sound = self.take_decoded("sound", full)
+            if sound is None:
+                sound = pg.mixer.Sound(str(full))
+            entry = self.store(key, sound, sound_bytes(sound))
+        return self.acquire(entry)
+
+    def add_decoded(self, kind: str, path: PathLike, value: Any):
+        """ Keep a decoded (not yet converted) file until someone asks for it """
+        key = (kind, str(self.path(path)))
+        nbytes = value.get_pitch() * value.get_height() if kind == "image" else sound_bytes(value)
+        self.drop_decoded([key])
+        self.decoded[key] = (value, nbytes)
+        self.decoded_bytes += nbytes
+        self.evict()
+
+    def take_decoded(self, kind: str, full: Path) -> Any:
+        item = self.decoded.pop((kind, str(full)), None)
+        if item is None:
+            return None
+        self.decoded_bytes -= item[1]
+        return item[0]
+
+    def drop_decoded(self, keys=None):
+        """ Forget decoded files nobody asked for (all of them by default) """
+        for key in list(self.decoded) if keys is None else keys:
+            item = self.decoded.pop(key, None)
+            if item is not None:
+                self.decoded_bytes -= item[1]
+
+    def release(self, value: Any):
+        """ Give back a reference taken by image/font/sound """
+        key = self.keys.get(id(value))
+        entry = self.entries.get(key) if key else None
+        if entry is None or entry.refs == 0:
+            return
+        entry.refs -= 1
+        if entry.refs == 0:
+            self.evict()
+
+    # --- Cache ---
+    def lookup(self, key: Tuple) -> Optional[Entry]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key: Tuple, value: Any, nbytes: int) -> Entry:
+        entry = Entry(key[0], value, nbytes)
+        self.entries[key] = entry
+        self.keys[id(value)] = key
+        self.loaded_bytes += nbytes
+        return entry
+
+    def acquire(self, entry: Entry) -> Any:
+        entry.refs += 1
+        self.evict()        # after taking the reference, so a new entry is never its own victim
+        return entry.value
+
+    @property
+    def total_bytes(self) -> int:
+        return self.loaded_bytes + self.decoded_bytes
+
+    def evict(self):
+        """ Drop decoded files, then unreferenced entries, oldest first, until back under budget """
+        if self.total_bytes <= self.budget:
+            self.over_budget = False
+            return
+        for key in list(self.decoded):
+            self.drop_decoded([key])
+            self.evictions += 1
+            if self.total_bytes <= self.budget:
+                self.over_budget = False
+                return
+        for key in [k for k, e in self.entries.items() if e.refs == 0]:
+            entry = self.entries.pop(key)
+            self.keys.pop(id(entry.value), None)
+            self.loaded_bytes -= entry.nbytes
+            self.evictions += 1
+            if self.total_bytes <= self.budget:
+                self.over_budget = False
+                return
+        if not self.over_budget:
+            # Everything left is in use; warn once until we get back under budget
+            self.over_budget = True
+            print(f"[Resources] Warning: {self.total_bytes / 2**20:.1f} MB in use, "
+                  f"budget is {self.budget / 2**20:.1f} MB")
+
+    def stats(self) -> Dict:
+        by_kind: Dict[str, int] = {}
+        for entry in self.entries.values():
+            by_kind[entry.kind] = by_kind.get(entry.kind, 0) + entry.nbytes
+        return {
+            "entries": len(self.entries),
+            "loaded_bytes": self.loaded_bytes,
+            "decoded": len(self.decoded),
+            "decoded_bytes": self.decoded_bytes,
+            "budget_bytes": self.budget,
+            "bytes_by_kind": by_kind,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def sound_bytes(sound: pg.mixer.Sound) -> int:
+    """ Decoded size of a sound in the mixer's format """
+    init = pg.mixer.get_init()
+    if not init:
+        return 0
+    freq, bits, channels = init
+    return int(sound.get_length() * freq * channels * (abs(bits) // 8))
+
+
+# One manager for the whole game
+RESOURCES = ResourceManager()
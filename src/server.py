@@ -0,0 +1,271 @@
+# src/server.py
+""" Authoritative game server
+
+Clients connect over TCP or a Unix socket and exchange newline-delimited
+JSON. The server owns every `GameSession`: clicks are only requests, the
+server decides hits and sends back the events and the final result.
+
+    -> {"op": "start", "difficulty": 0}
+    -> {"op": "click", "x": 512, "y": 300}
+    <- {"event": "spawn", "id": 1, "pos": [448.0, 192.0]}
+    <- {"event": "hit", "id": 1, "score": 1}
+    <- {"event": "end", "score": 12, "hits": 12, "misses": 3, ...}
+
+Usage: python run.py --server [--port 8765 | --unix /tmp/waz.sock]
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional
+try:
+    from .engine import GameSession, GAME_TIME, SCREEN_SIZE
+    from .leaderboard import Leaderboard
+except ImportError:
+    from engine import GameSession, GAME_TIME, SCREEN_SIZE
+    from leaderboard import Leaderboard
+
+
+class Client:
+    """ A connection and the session it plays """
+    def __init__(self, cid: int, writer: Optional[asyncio.StreamWriter]):
+        self.cid = cid
+        self.writer = writer
+        self.session: Optional[GameSession] = None
+        self.pending: List[tuple] = []      # clicks waiting for the next tick
+        self.last_tick = time.monotonic()
+        self.click_times: List[float] = []
+
+    def send(self, events: List[Dict]):
+        if self.writer is None or not events:
+            return
+        self.writer.write(b"".join(json.dumps(e).encode() + b"\n" for e in events))
+
+
+class GameServer:
+    def __init__(self, tick_rate: float = 60.0, batch_size: int = 512,
+                 time_limit: float = GAME_TIME, max_cps: float = 15.0,
+                 max_buffer: int = 256 * 1024, backlog: int = 1024, max_pending: int = 8,
+                 client_seeds: bool = False, leaderboard: Optional[Leaderboard] = None):
+        self.tick_rate = tick_rate
+        self.batch_size = batch_size
+        self.time_limit = time_limit
+        self.max_cps = max_cps              # clicks per second a human could plausibly make
+        self.max_buffer = max_buffer        # drop clients that stop reading
+        self.backlog = backlog              # pending connects when a tournament starts
+        self.max_pending = max_pending      # clicks queued per client between two ticks
+        self.client_seeds = client_seeds    # honour "seed" in start (benchmarks/debugging only)
+        self.leaderboard = leaderboard
+
+        self.clients: Dict[int, Client] = {}
+        self.next_id = 0
+        self.results: int = 0
+        self.ticks: int = 0
+        self.session_ticks: int = 0
+        self.overruns: int = 0
+
+    # --- Sessions ---
+    def add_client(self, writer: Optional[asyncio.StreamWriter] = None) -> Client:
+        self.next_id += 1
+        client = Client(self.next_id, writer)
+        self.clients[client.cid] = client
+        return client
+
+    def remove_client(self, client: Client):
+        self.clients.pop(client.cid, None)
+
+    def handle_message(self, client: Client, msg: Dict):
+        """ Apply one client message; clicks are deferred to the next tick """
+        op = msg.get("op")
+        if op == "start":
+            try:
+                # The server picks the spawn sequence; a known seed would let players pre-click
+                seed = msg.get("seed") if self.client_seeds else None
+                client.session = GameSession(int(msg.get("difficulty", 0)), self.time_limit,
+                                             seed=seed)
+            except (TypeError, ValueError) as e:
+                client.send([{"event": "error", "message": str(e)}])
+                return
+            client.session.start()
+            client.last_tick = time.monotonic()
+            client.pending.clear()
+            client.send([{"event": "holes", "pos": client.session.holes_center}])
+        elif op == "click":
+            try:
+                pos = (float(msg["x"]), float(msg["y"]))
+            except (KeyError, TypeError, ValueError):
+                client.send([{"event": "error", "message": "click needs numeric x and y"}])
+                return
+            if client.session is None:
+                client.send([{"event": "error", "message": "no round in progress"}])
+                return
+            if len(client.pending) >= self.max_pending:
+                # Whatever the session already did (start, spawn) happened before this click
+                client.send(client.session.drain_events() + [{"event": "rejected", "reason": "rate"}])
+                return
+            client.pending.append(pos)
+        else:
+            client.send([{"event": "error", "message": f"unknown op: {op!r}"}])
+
+    def validate_click(self, client: Client, pos, now: float) -> Optional[str]:
+        """ Reason to reject a click, or None if it may be scored """
+        w, h = SCREEN_SIZE
+        if not (0 <= pos[0] < w and 0 <= pos[1] < h):
+            return "off-screen"
+        window = [t for t in client.click_times if now - t < 1.0]
+        if len(window) >= self.max_cps:
+            client.click_times = window
+            return "rate"
+        window.append(now)
+        client.click_times = window
+        return None
+
+    def tick_client(self, client: Client, now: float):
+        session = client.session
+        if session is None:
+            return
+        dt = now - client.last_tick
+        client.last_tick = now
+
+        # Events first, then timers, same order as the game loop; what is
+        # sent back keeps the order things happened in
+        events = session.drain_events()
+        for pos in client.pending:
+            reason = self.validate_click(client, pos, now)
+            if reason:
+                events.append({"event": "rejected", "reason": reason})
+            else:
+                session.click(pos)
+                events += session.drain_events()
+        client.pending.clear()
+        session.tick(dt)
+        self.session_ticks += 1
+
+        events += session.drain_events()
+        if session.finished:
+            self.finish(client)
+        client.send(events)
+        if client.writer and client.writer.transport.get_write_buffer_size() > self.max_buffer:
+            print(f"[Server] Dropping client {client.cid}: not reading")
+            self.remove_client(client)
+            client.writer.close()
+
+    def finish(self, client: Client):
+        session = client.session
+        self.results += 1
+        if self.leaderboard:
+            self.leaderboard.submit(session.difficulty, session.score,
+                                    session.hits, session.misses)
+        client.session = None
+
+    async def tick_all(self):
+        """ Tick every session once, yielding to I/O between batches """
+        clients = list(self.clients.values())
+        for i in range(0, len(clients), self.batch_size):
+            now = time.monotonic()
+            for client in clients[i:i + self.batch_size]:
+                self.tick_client(client, now)
+            await asyncio.sleep(0)
+        self.ticks += 1
+
+    async def run_ticks(self):
+        period = 1.0 / self.tick_rate
+        deadline = time.monotonic()
+        while True:
+            await self.tick_all()
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                # Fell behind: skip the missed ticks instead of bursting
+                self.overruns += 1
+                deadline = time.monotonic()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    # --- Networking ---
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = self.add_client(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the stream limit (LimitOverrunError); the rest can't be framed
+                    client.send([{"event": "error", "message": "message too long"}])
+                    break
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                except json.JSONDecodeError:
+                    client.send([{"event": "error", "message": "invalid json"}])
+                    continue
+                if not isinstance(msg, dict) or msg.get("op") == "quit":
+                    break
+                self.handle_message(client, msg)
+                if writer.transport.get_write_buffer_size() > self.max_buffer:
+                    print(f"[Server] Dropping client {client.cid}: not reading")
+                    break
+                await writer.drain()
+        except (OSError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.remove_client(client)
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix_path: Optional[str] = None):
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, unix_path,
+                                                     backlog=self.backlog)
+            where = unix_path
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port,
+                                                backlog=self.backlog)
+            where = f"{host}:{port}"
+        print(f"[Server] Listening on {where} at {self.tick_rate:g} ticks/s")
+        ticker = asyncio.create_task(self.run_ticks())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            ticker.cancel()
+
+    def stats(self) -> Dict:
+        return {
+            "clients": len(self.clients),
+            "ticks": self.ticks,
+            "session_ticks": self.session_ticks,
+            "overruns": self.overruns,
+            "results": self.results,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Whack-a-Zombie authoritative server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--tick-rate", type=float, default=60.0)
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--time-limit", type=float, default=GAME_TIME)
+    parser.add_argument("--leaderboard", action="store_true", help="save results to the leaderboard")
+    parser.add_argument("--client-seeds", action="store_true",
+                        help="let clients pick the spawn seed (benchmarks/debugging only)")
+    args = parser.parse_args(argv)
+
+    leaderboard = Leaderboard() if args.leaderboard else None
+    server = GameServer(args.tick_rate, args.batch_size, args.time_limit,
+                        client_seeds=args.client_seeds, leaderboard=leaderboard)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if leaderboard:
+            leaderboard.close()
+        print(f"[Server] {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
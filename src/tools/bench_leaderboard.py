@@ -0,0 +1,111 @@
+""" Load benchmark for the SQLite leaderboard
+
+Usage: python -m src.tools.bench_leaderboard [--rows 1000000] [--games 2000]
+
+Prefills a throwaway database to kiosk-scale volume, then measures the
+numbers the game loop cares about: how long `submit` blocks, how long until
+queued games are on disk, and top-K latency cached vs. uncached.
+"""
+import argparse
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.leaderboard import Leaderboard, SCHEMA, TOP_QUERY
+
+
+def prefill(path: Path, rows: int, seed: int = 7):
+    rng = random.Random(seed)
+    conn = sqlite3.connect(str(path))
+    conn.executescript(SCHEMA)
+    now = time.time()
+    chunk = 50_000
+    with conn:
+        for start in range(0, rows, chunk):
+            batch = []
+            for i in range(start, min(rows, start + chunk)):
+                hits = rng.randrange(0, 40)
+                misses = rng.randrange(0, 20)
+                batch.append((rng.randrange(3), hits, hits, misses, now - i))
+            conn.executemany(
+                "INSERT INTO scores (difficulty, score, hits, misses, created_at)"
+                " VALUES (?, ?, ?, ?, ?)", batch)
+    conn.close()
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def report(name, samples_s):
+    ms = [s * 1000 for s in samples_s]
+    print(f"  {name:<28} mean {statistics.mean(ms):8.4f} ms   "
+          f"p99 {percentile(ms, 99):8.4f} ms   max {max(ms):8.4f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows to prefill")
+    parser.add_argument("--games", type=int, default=2_000, help="games to submit")
+    parser.add_argument("--queries", type=int, default=500, help="top-K queries to time")
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "scores.db"
+
+        t0 = time.perf_counter()
+        prefill(path, args.rows)
+        print(f"Prefilled {args.rows:,} rows in {time.perf_counter() - t0:.2f} s")
+
+        board = Leaderboard(path, top_k=args.k)
+        rng = random.Random(11)
+
+        # Submitting must never stall a frame
+        submit = []
+        t0 = time.perf_counter()
+        for _ in range(args.games):
+            s = time.perf_counter()
+            board.submit(rng.randrange(3), rng.randrange(40), rng.randrange(40), rng.randrange(20))
+            submit.append(time.perf_counter() - s)
+        board.flush()
+        drained = time.perf_counter() - t0
+
+        # Cached top-K is what the replay board calls every frame
+        for d in range(3):
+            board.top(d)
+        board.flush()
+        cached = []
+        for i in range(args.queries):
+            s = time.perf_counter()
+            board.top(i % 3)
+            cached.append(time.perf_counter() - s)
+
+        # Uncached query cost, paid on the writer thread after each insert
+        conn = sqlite3.connect(str(path))
+        uncached = []
+        for i in range(args.queries):
+            s = time.perf_counter()
+            conn.execute(TOP_QUERY, (i % 3, args.k)).fetchall()
+            uncached.append(time.perf_counter() - s)
+        plan = conn.execute("EXPLAIN QUERY PLAN " + TOP_QUERY, (0, args.k)).fetchall()
+        conn.close()
+
+        total = board.count()
+        board.close()
+
+    print(f"Rows after run: {total:,}")
+    print(f"Submitted {args.games:,} games, all on disk after {drained * 1000:.1f} ms "
+          f"({args.games / drained:,.0f} games/s)")
+    report("submit() (game loop)", submit)
+    report(f"top({args.k}) cached", cached)
+    report(f"top({args.k}) SQL uncached", uncached)
+    print("Query plan: " + "; ".join(row[-1] for row in plan))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+""" Frame pacing strategies compared
+
+Usage: python -m src.tools.bench_pacing [--frames 300] [--work-ms 4] [--fps 60]
+
+Runs `FramePacer` with each strategy (and auto) for a number of frames
+with a simulated frame of `work-ms` +-50% CPU work, then prints the frame
+interval jitter, dropped frames and how much CPU the waiting cost.
+vsync is only included with --vsync (needs a real display).
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame as pg
+
+from src.pacing import FramePacer, STRATEGIES
+
+
+def work(ms: float):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--work-ms", type=float, default=4.0)
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--vsync", action="store_true")
+    args = parser.parse_args()
+
+    pg.init()
+    if args.vsync:
+        pg.display.set_mode((640, 480), pg.SCALED, vsync=1)
+    rng = random.Random(1)
+    strategies = [s for s in STRATEGIES if s != "vsync" or args.vsync]
+
+    print(f"{'strategy':>10} {'mean ms':>8} {'stddev':>7} {'rms':>7} {'max dev':>8} "
+          f"{'dropped':>8} {'cpu %':>6}")
+    for strategy in strategies + ["auto"]:
+        pacer = FramePacer(args.fps, strategy=strategy, vsync=args.vsync)
+        frames = args.frames + (len(strategies) * pacer.trial_frames if strategy == "auto" else 0)
+        cpu0 = time.process_time()
+        wall0 = time.perf_counter()
+        for _ in range(frames):
+            work(args.work_ms * rng.uniform(0.5, 1.5))
+            if args.vsync:
+                pg.display.flip()
+            pacer.wait()
+        cpu = (time.process_time() - cpu0) / (time.perf_counter() - wall0) * 100
+        s = pacer.stats()
+        name = strategy if strategy != "auto" else f"auto:{pacer.strategy}"
+        print(f"{name:>10} {s['mean_ms']:>8.3f} {s['stddev_ms']:>7.3f} {s['rms_ms']:>7.3f} "
+              f"{s['max_dev_ms']:>8.3f} {s['dropped']:>8} {cpu:>6.0f}")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
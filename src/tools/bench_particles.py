@@ -0,0 +1,55 @@
+""" Frame cost of the particle system
+
+Usage: python -m src.tools.bench_particles [--counts 1000 5000 10000 20000 50000]
+
+Fills the pool with N live particles and times `update` and `draw`
+separately on a 1024x768 surface (SDL dummy video driver, so this is
+pure CPU blitting with no display overhead).
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame as pg
+
+from src.particles import ParticleSystem
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 5000, 10000, 20000, 50000])
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    pg.init()
+    screen = pg.display.set_mode((1024, 768))
+    dt = 1 / 60
+
+    print(f"{'particles':>10} {'update ms':>10} {'draw ms':>10} {'total ms':>10}  (of 16.67 ms)")
+    for n in args.counts:
+        particles = ParticleSystem(screen, capacity=n, seed=1)
+        update, draw = [], []
+        for _ in range(args.frames):
+            # Keep the pool full with a mix of both kinds spread over the screen
+            missing = n - particles.count
+            if missing:
+                x, y = particles.rng.uniform((100, 100), (924, 668))
+                particles.emit("splatter", (x, y), missing // 2)
+                particles.emit("dust", (x, y), missing - missing // 2)
+            screen.fill((0, 0, 0))
+            t0 = time.perf_counter()
+            particles.update(dt)
+            t1 = time.perf_counter()
+            particles.draw()
+            t2 = time.perf_counter()
+            update.append((t1 - t0) * 1000)
+            draw.append((t2 - t1) * 1000)
+        u, d = statistics.median(update), statistics.median(draw)
+        print(f"{n:>10,} {u:>10.3f} {d:>10.3f} {u + d:>10.3f}")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
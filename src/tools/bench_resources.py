@@ -0,0 +1,89 @@
+""" Resource manager budget and eviction
+
+Usage: python -m src.tools.bench_resources [--budget-mb 0.25]
+
+Loads every image under assets/images through a private ResourceManager
+with a small budget and reports load times, cache hits and evictions:
+  1. cold loads while every reference is held (over budget, nothing to evict)
+  2. release everything: least recently used entries are evicted to fit
+  3. load again, most recently used first: survivors are cache hits,
+     evicted ones are read from disk
+  4. files decoded ahead of time count against the budget and go first
+Exits with status 1 if the manager ends up over budget or its byte
+counts don't add up.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame as pg
+
+from src.loader import decode_image
+from src.resources import ASSETS, ResourceManager
+
+
+def load_all(resources: ResourceManager, paths):
+    t0 = time.perf_counter()
+    images = [resources.image(p, (64, 64)) for p in paths]
+    return images, (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-mb", type=float, default=0.25)
+    args = parser.parse_args()
+
+    pg.init()
+    pg.display.set_mode((1024, 768))
+    paths = sorted((ASSETS / "images").rglob("*.png"))
+    resources = ResourceManager(budget_mb=args.budget_mb)
+    failures = []
+
+    def report(step: str, ms: float = None):
+        s = resources.stats()
+        took = f"{ms:8.2f} ms" if ms is not None else " " * 11
+        print(f"{step:<28} {took}  {s['entries']:>4} entries  {resources.total_bytes / 1024:>8.1f} KiB  "
+              f"hits {s['hits']:>4}  misses {s['misses']:>4}  evictions {s['evictions']:>4}")
+        if resources.loaded_bytes != sum(e.nbytes for e in resources.entries.values()):
+            failures.append(f"{step}: loaded_bytes out of sync")
+
+    print(f"{len(paths)} images at 64x64, budget {args.budget_mb} MB")
+    images, ms = load_all(resources, paths)
+    report("1. cold, all held", ms)
+    over_budget = resources.total_bytes > resources.budget
+
+    for img in images:
+        resources.release(img)
+    report("2. all released")
+    if resources.total_bytes > resources.budget:
+        failures.append("still over budget after releasing everything")
+    if over_budget and resources.evictions == 0:
+        failures.append("nothing was evicted")
+
+    images, ms = load_all(resources, paths[::-1])
+    report("3. reloaded", ms)
+    for img in images:
+        resources.release(img)
+
+    before = resources.decoded_bytes
+    for p in paths:
+        resources.add_decoded("image", p, decode_image(resources.path(p)))
+    report("4. decoded ahead")
+    if resources.total_bytes > resources.budget and resources.decoded:
+        failures.append("decoded files kept while over budget")
+    resources.drop_decoded()
+    if resources.decoded_bytes != before:
+        failures.append("decoded_bytes out of sync after drop_decoded")
+    report("   dropped")
+
+    pg.quit()
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+""" Throughput benchmark for the authoritative game server
+
+Usage: python -m src.tools.bench_server [--sessions 10000] [--clients 200]
+
+1. Tick throughput: sessions are ticked in-process (no sockets) on one
+   core; reports session-ticks/s and how many sessions fit at 60 ticks/s.
+2. Socket run (--clients > 0): real clients on a Unix socket in the same
+   process play full rounds, clicking on every spawn they are told about.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from src.server import GameServer
+
+TICK_RATE = 60
+
+
+async def bench_ticks(sessions: int, ticks: int, batch_size: int):
+    server = GameServer(TICK_RATE, batch_size, time_limit=3600, client_seeds=True)
+    rng = random.Random(3)
+    for i in range(sessions):
+        client = server.add_client()
+        server.handle_message(client, {"op": "start", "difficulty": i % 3, "seed": i})
+
+    dt = 1.0 / TICK_RATE
+    clients = list(server.clients.values())
+    t0 = time.process_time()
+    for _ in range(ticks):
+        # Roughly one click per session every 20 frames, near the target
+        for client in rng.sample(clients, len(clients) // 20):
+            x, y = client.session.current_pos
+            client.pending.append((x + rng.uniform(-40, 40), y + rng.uniform(-40, 40)))
+        for client in clients:
+            client.last_tick -= dt      # simulate a full tick of elapsed time
+        await server.tick_all()
+    cpu = time.process_time() - t0
+
+    rate = server.session_ticks / cpu
+    print(f"Tick throughput: {sessions:,} sessions x {ticks} ticks in {cpu:.2f} s CPU")
+    print(f"  {rate:,.0f} session-ticks/s per core -> "
+          f"~{rate / TICK_RATE:,.0f} sessions per core at {TICK_RATE} ticks/s")
+
+
+async def play(path: str, difficulty: int, seed: int, stats: dict):
+    reader, writer = await asyncio.open_unix_connection(path)
+    rng = random.Random(seed)
+    writer.write(json.dumps({"op": "start", "difficulty": difficulty, "seed": seed}).encode() + b"\n")
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        stats["events"] += 1
+        event = json.loads(line)
+        if event["event"] == "spawn":
+            # Human-ish reaction time before clicking
+            await asyncio.sleep(rng.uniform(0.15, 0.4))
+            x, y = event["pos"]
+            writer.write(json.dumps({"op": "click", "x": x + rng.uniform(-30, 30),
+                                     "y": y + rng.uniform(-30, 30)}).encode() + b"\n")
+            stats["clicks"] += 1
+        elif event["event"] == "end":
+            stats["results"] += 1
+            break
+    writer.close()
+
+
+async def bench_sockets(clients: int, time_limit: float):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "waz.sock")
+        server = GameServer(TICK_RATE, time_limit=time_limit, client_seeds=True)
+        listener = await asyncio.start_unix_server(server.handle_connection, path,
+                                                   backlog=server.backlog)
+        ticker = asyncio.create_task(server.run_ticks())
+
+        stats = {"events": 0, "clicks": 0, "results": 0}
+        t0 = time.perf_counter()
+        cpu0 = time.process_time()
+        await asyncio.gather(*(play(path, i % 3, i, stats) for i in range(clients)))
+        wall = time.perf_counter() - t0
+        cpu = time.process_time() - cpu0
+
+        # Let the server see every disconnect before shutting down
+        while server.clients:
+            await asyncio.sleep(0.01)
+        ticker.cancel()
+        listener.close()
+        await listener.wait_closed()
+
+    expected_ticks = wall * TICK_RATE
+    print(f"Socket run: {clients} clients, {time_limit:g} s rounds, {wall:.2f} s wall, {cpu:.2f} s CPU")
+    print(f"  results {stats['results']}/{clients}, {stats['events'] / wall:,.0f} events/s, "
+          f"{stats['clicks'] / wall:,.0f} clicks/s")
+    print(f"  server ticks {server.ticks} of ~{expected_ticks:.0f} expected, overruns {server.overruns}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--ticks", type=int, default=120)
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--time-limit", type=float, default=5.0)
+    args = parser.parse_args()
+
+    asyncio.run(bench_ticks(args.sessions, args.ticks, args.batch_size))
+    if args.clients > 0:
+        asyncio.run(bench_sockets(args.clients, args.time_limit))
+
+
+if __name__ == "__main__":
+    main()
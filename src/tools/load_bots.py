@@ -0,0 +1,90 @@
+""" Load harness: many bots playing in parallel
+
+Usage:
+    python -m src.tools.load_bots --mode engine --bots 64 --games 5
+    python -m src.tools.load_bots --mode pygame --bots 4 --time-limit 5
+
+engine: each bot plays headless `GameSession`s in simulated time.
+pygame: each bot drives the real `main()` loop in its own process under
+        SDL's dummy video/audio drivers.
+
+Reports frame time, events per second and whether every click the bots
+meant to land was registered as a hit.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import statistics
+import time
+
+
+def run_engine_bot(args):
+    from src.bots import Bot, PROFILES, play_session
+    index, profile, games, difficulty, time_limit = args
+    bot = Bot(PROFILES[profile], seed=index)
+    report = None
+    for game in range(games):
+        report = play_session(bot, difficulty, time_limit, seed=index * 1000 + game, report=report)
+    return report.as_dict()
+
+
+def run_pygame_bot(args):
+    index, profile, games, difficulty, time_limit = args
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    from src.bots import Bot, PROFILES, PygameDriver
+    from src import whack_a_zombie
+
+    driver = PygameDriver(Bot(PROFILES[profile], seed=index), games, difficulty)
+    try:
+        # In-memory scores: bot games must never reach the real leaderboard
+        whack_a_zombie.main(frame_hook=driver, time_limit=time_limit, leaderboard_path=None)
+    except SystemExit:
+        pass
+    return driver.report.as_dict()
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["engine", "pygame"], default="engine")
+    parser.add_argument("--bots", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--games", type=int, default=2, help="rounds per bot")
+    parser.add_argument("--profile", choices=["casual", "average", "pro"], default="average")
+    parser.add_argument("--difficulty", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    job = run_engine_bot if args.mode == "engine" else run_pygame_bot
+    jobs = [(i, args.profile, args.games, args.difficulty, args.time_limit) for i in range(args.bots)]
+
+    t0 = time.perf_counter()
+    # Fresh interpreter per bot: the game opens its display at import and quits it on exit
+    with mp.get_context("spawn").Pool(min(args.workers, args.bots), maxtasksperchild=1) as pool:
+        reports = pool.map(job, jobs, chunksize=1)
+    wall = time.perf_counter() - t0
+
+    frames = [ms for r in reports for ms in r["frame_ms"]]
+    games = [g for r in reports for g in r["games"]]
+    clicks = sum(r["clicks"] for r in reports)
+    registered = sum(g["registered"] for g in games)
+    expected = sum(g["expected"] for g in games)
+    mismatched = sum(1 for g in games if g["registered"] != g["expected"])
+
+    print(f"{args.mode}: {args.bots} bots x {args.games} games ({args.profile}), {wall:.2f} s wall")
+    if frames:
+        print(f"  frame time   mean {statistics.mean(frames):.3f} ms   p99 {percentile(frames, 99):.3f} ms"
+              f"   max {max(frames):.3f} ms   ({len(frames):,} frames)")
+    print(f"  events       {clicks:,} clicks, {clicks / wall:,.0f} clicks/s, "
+          f"{len(frames) / wall:,.0f} frames/s")
+    print(f"  hits         registered {registered:,} / expected {expected:,}, "
+          f"{mismatched} of {len(games)} games mismatched")
+
+
+if __name__ == "__main__":
+    main()
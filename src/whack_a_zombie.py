@@ -10,6 +10,16 @@ try:
     from .zombies import Zombies
     from .ReplayBoard import ReplayBoard
     from .menu import Menu
+    from .leaderboard import Leaderboard, DB_PATH
+    from .quality import QualityGovernor
+    from .renderer import Renderer
+    from .particles import ParticleSystem
+    from .capture import FrameCapture
+    from .resources import RESOURCES
+    from .loader import AssetLoader
+    from .pacing import FramePacer
+    from .profiler import SamplingProfiler
+    from .engine import GAME_TIME, NUM_SPAWNS, TILE_SIZE, ZOMBIE_SIZE, GameSession, holes_grid
 except ImportError:
     from background import Background
     from SoundManager import SoundManager
@@ -18,82 +28,56 @@ except ImportError:
     from zombies import Zombies
     from ReplayBoard import ReplayBoard
     from menu import Menu
+    from leaderboard import Leaderboard, DB_PATH
+    from quality import QualityGovernor
+    from renderer import Renderer
+    from particles import ParticleSystem
+    from capture import FrameCapture
+    from resources import RESOURCES
+    from loader import AssetLoader
+    from pacing import FramePacer
+    from profiler import SamplingProfiler
+    from engine import GAME_TIME, NUM_SPAWNS, TILE_SIZE, ZOMBIE_SIZE, GameSession, holes_grid
+import os
 import sys
-import random
-from typing import List, Tuple
-import math
+import sqlite3
+import time
+from typing import Callable, Dict, Optional
 
 # Initialize
 pg.init()
-SCREEN_WIDTH, SCREEN_HEIGHT = 1024, 768
-TILE_SIZE = 64
-HOLE_SIZE = 128
-SCREEN = pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+SCREEN_WIDTH, SCREEN_HEIGHT = 1024, 768     # Logical resolution, see renderer.py
+RENDERER = Renderer((SCREEN_WIDTH, SCREEN_HEIGHT))
+SCREEN = RENDERER.surface
 FPS = 60
 pg.display.set_caption("Whack a Zombies")
 
-# GAME CONSTANTS
-GAME_TIME = 20
-SCORE_PER_HIT = 1
-ZOMBIE_SIZE = 64
-
-""" Helper Functions """
-def gen_pos(cols, rows) -> List[List]:
-    """ Generate positions for Holes """
-    w, h = SCREEN.get_size()       
-    padding_col = (w - HOLE_SIZE * cols) / (cols + 1)
-    padding_row = (h - HOLE_SIZE * rows) / (rows + 1)
-
-    grid = [[None]*cols for _ in range(rows)]
-    for r in range(rows):
-        y = r * HOLE_SIZE + (r + 1) * padding_row
-        for c in range(cols):
-            x = c * HOLE_SIZE + (c + 1) * padding_col
-            grid[r][c] = (int(x), int(y))
-    return grid
-
-def collide(mouse_pos, spawn_pos: Tuple[float, float]) -> bool:
-    """ Check if Zombie is clicked or not """
-    radius = TILE_SIZE
-    x_mouse, y_mouse = mouse_pos
-    x_center, y_center = spawn_pos
-    distance = math.sqrt(
-        math.pow(x_mouse - x_center, 2) + \
-        math.pow(y_mouse - y_center, 2)
-    )
-    if distance <= radius:
-        return True
-    return False
-
-def center_pos(pos: Tuple[float, float]) -> Tuple[float, float]:
-    """ Centering the Position """
-    x, y = pos
-    return (x + HOLE_SIZE / 2, y + HOLE_SIZE / 2)
-
-def main():
-    # Initialize
-    clock = pg.time.Clock()
+# Game rules and sizes live in engine.py; a round is an engine.GameSession
+
+def main(frame_hook: Optional[Callable[[Dict], None]] = None, time_limit: float = GAME_TIME,
+         leaderboard_path: Optional[Path] = DB_PATH):
+    """ Run the game; `frame_hook` is called after every frame with a snapshot of the state
+
+    `leaderboard_path=None` keeps scores in memory only (bots, test runs).
+    """
+    # Initialize (WAZ_PACING=auto|vsync|sleep|hybrid|busy, see pacing.py)
+    pacer = FramePacer(FPS, vsync=RENDERER.vsync)
+
+    # Sampling profiler (F10, WAZ_PROFILE=1, WAZ_PROFILE_SPIKE_MS=<ms>)
+    profiler = SamplingProfiler()
 
     # Hole layout (3 levels: 6 -> 9 -> 12)
-    num_spawns = [6, 9, 12]
+    num_spawns = NUM_SPAWNS
 
     # Difficulty of the game
     difficulty = 0
 
-    match num_spawns[difficulty]:
-        case (6 | 9) as n:
-            cols = 3
-            rows = n // 3
-            holes_grid = gen_pos(cols, rows)
-        case 12 as n:
-            cols = 4
-            rows = n // 4
-            holes_grid = gen_pos(cols, rows)
-        case _:
-            raise ValueError(f"Unexpected: {num_spawns}")
-
-    holes_positions = [pos for row in holes_grid for pos in row]
-    holes_center = [center_pos(pos) for pos in holes_positions]     # Standardize the positions of holds
+    # Assets are decoded on worker threads: the menu's first, the rest while the menu is up
+    loader = AssetLoader()
+    loader.submit("menu", images=Background.asset_paths() + Menu.asset_paths())
+    loader.submit("game", images=Zombies.asset_paths() + Cursor.asset_paths(),
+                  sounds=SoundManager.asset_paths())
+    loader.wait("menu")
 
     # Background
     bg = Background(SCREEN, TILE_SIZE)
@@ -101,13 +85,54 @@ def main():
     # Menu
     menu = Menu(SCREEN)
 
+    # Scoreboard
+    scoreboard = ScoreBoard(SCREEN, time_limit=time_limit)
+
+    # Hit / miss effects
+    particles = ParticleSystem(SCREEN)
+
+    # Initialize ReplayBoard
+    replay_board = ReplayBoard(SCREEN)
+
+    # High scores (written in the background, never blocks a frame)
+    try:
+        leaderboard = Leaderboard(leaderboard_path)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: leaderboard disabled: {e}")
+        leaderboard = None
+
+    # Menu is live while the game assets finish loading; Play is held back until then
+    first_frame = True
+    while not loader.done("game"):
+        for e in pg.event.get():
+            e = RENDERER.map_event(e)
+            action = "quit" if e.type == pg.QUIT else menu.handle_events(e)
+            if action == "right":
+                difficulty = (difficulty + 1) % len(num_spawns)
+            elif action == "left":
+                difficulty = (difficulty - 1) % len(num_spawns)
+            elif action == "quit":
+                loader.close()
+                profiler.close()
+                if leaderboard:
+                    leaderboard.close()
+                pg.quit()
+                sys.exit(0)
+
+        grid = holes_grid(num_spawns[difficulty], SCREEN.get_size())
+        bg.draw([pos for row in grid for pos in row])
+        scoreboard.draw()
+        menu.draw(difficulty, loading=True)
+        RENDERER.present()
+        if first_frame:
+            loader.mark("first frame")
+            first_frame = False
+        pacer.wait()
+
     # Audio
     music = SoundManager()
     music.play_background_music()
 
-    # Scoreboard
-    scoreboard = ScoreBoard(SCREEN, time_limit=GAME_TIME)
-
     # Cursor
     pg.mouse.set_visible(False)
     cursor = Cursor(SCREEN)
@@ -115,54 +140,70 @@ def main():
     # Zombies
     zombie = Zombies(SCREEN, ZOMBIE_SIZE, idle_fps=10, death_fps=12)
 
-    # Initialize ReplayBoard
-    replay_board = ReplayBoard(SCREEN)
-    
+    loader.mark("playable")
+    loader.close()
+
+    # Quality governor (WAZ_QUALITY=high|medium|low|minimal pins a tier)
+    governor = QualityGovernor(target_fps=FPS)
+    governor.apply(menu, replay_board, scoreboard, zombie, particles)
+    show_stats = False
+
+    # Gameplay capture (WAZ_CAPTURE=<dir> or F9)
+    capture = FrameCapture(RENDERER.window, os.environ["WAZ_CAPTURE"]) \
+        if os.environ.get("WAZ_CAPTURE") else None
+
+    # The round in progress (same rules as the server), None in the menu
+    session: Optional[GameSession] = None
+
     # Flags
     running = True
     playing = False
     show_menu = True
     show_replay_board = False
-
-    # Difficulty of the game
-    difficulty = 0
+    played_at = None    # leaderboard key of the last finished game
 
     while running:
-        dt = clock.get_time() / 1000
-
-        match num_spawns[difficulty]:
-            case (6 | 9) as n:
-                cols = 3
-                rows = n // 3
-                holes_grid = gen_pos(cols, rows)
-            case 12 as n:
-                cols = 4
-                rows = n // 4
-                holes_grid = gen_pos(cols, rows)
-            case _:
-                raise ValueError(f"Unexpected: {num_spawns}")
-
-        holes_positions = [pos for row in holes_grid for pos in row]
-        holes_center = [center_pos(pos) for pos in holes_positions]  # Standardize the positions of holds
+        frame_start = time.perf_counter()
+        dt = pacer.dt   # measured interval of the last frame, not rounded to ms
+
+        grid = holes_grid(num_spawns[difficulty], SCREEN.get_size())
+        holes_positions = [pos for row in grid for pos in row]
 
         for e in pg.event.get():
             """ Events for game play """
+            e = RENDERER.map_event(e)
             if e.type == pg.QUIT:
                 running = False
+                if leaderboard:
+                    leaderboard.close()
+                if capture:
+                    capture.close()
+                profiler.close()
                 pg.quit()
                 sys.exit(0)
 
+            if e.type == pg.KEYDOWN and e.key == pg.K_F3:
+                # Toggle FPS / quality tier readout
+                show_stats = not show_stats
+            elif e.type == pg.KEYDOWN and e.key == pg.K_F9:
+                # Start / stop recording
+                if capture:
+                    capture.close(wait=False)
+                    capture = None
+                else:
+                    capture = FrameCapture(RENDERER.window)
+            elif e.type == pg.KEYDOWN and e.key == pg.K_F10:
+                # Start / stop a sampling profile
+                profiler.toggle()
+
             # Handle replay board events when it's shown
             if show_menu:
                 action = menu.handle_events(e)
                 if action == "play":
-                    playing = True
                     show_menu = False
                     show_replay_board = False
-                    scoreboard.reset()
-                    current_pos = random.choice(holes_center)
-                    zombie.play_idle()
-                    zombie.reset()
+                    session = GameSession(difficulty, time_limit, zombie=zombie)
+                    session.start()
                 elif action == "right":
                     match difficulty:
                         case 0: difficulty = 1
@@ -175,70 +216,65 @@ def main():
                         case 0: difficulty = 2
                 elif action == "quit":
                     running = False
+                    if leaderboard:
+                        leaderboard.close()
+                    if capture:
+                        capture.close()
+                    profiler.close()
                     pg.quit()
                     sys.exit(0)
             elif show_replay_board:
                 action = replay_board.handle_events(e)
                 if action == "replay":
                     # Restart the game
-                    playing = True
                     show_menu = False
                     show_replay_board = False
-                    scoreboard.reset()
-                    current_pos = random.choice(holes_center)
-                    zombie.play_idle()
-                    zombie.reset()
+                    session = GameSession(difficulty, time_limit, zombie=zombie)
+                    session.start()
                 elif action == "menu":
-                    playing = False
                     show_menu = True
                     show_replay_board = False
+                    session = None
                     scoreboard.reset()
-                    zombie.reset()
             else:
                 # Normal gameplay events
                 if e.type == pg.MOUSEBUTTONDOWN and e.button == 1:
                     cursor.mouse_down()
-                    if collide(e.pos, current_pos):
-                        if playing and zombie.state != "death" and not zombie.hit:
-                            music.play_sound("hit")
-                            zombie.play_death()
-                            zombie.hit = True
-                            scoreboard.increase_score(SCORE_PER_HIT)
-                            print("Click: HIT")
-                    else:
-                        # Fallback sound/UX if they clicked empty space:
-                        music.play_sound("miss")
+                    if session:
+                        session.click(e.pos)
                 elif e.type == pg.KEYDOWN and e.key == pg.K_r and not show_replay_board:
                     # Restart during gameplay
-                    playing = True
-                    scoreboard.reset()
-                    current_pos = random.choice(holes_center)
-                    zombie.play_idle()
-                    zombie.reset()
+                    session = GameSession(difficulty, time_limit, zombie=zombie)
+                    session.start()
 
-        # Update game timer
-        if playing:
-            playing = scoreboard.update()
-            # Show replay board when game ends
-            if not playing:
-                show_replay_board = True
-
-        # Random Zombie
-        zombie.update(dt)   # Update next Frame
-        if zombie.state == "idle" and zombie.respawn_timer <= 0:
-            zombie.stay_timer -= dt
-            if zombie.stay_timer <= 0 and playing:
-                scoreboard.increase_misses() 
-                print("Click: MISS")
-                current_pos = random.choice(holes_center)
-                zombie.play_idle()
-                zombie.reset()
-        if zombie.is_finished and zombie.linger <= 0:
-            zombie.respawn_timer += dt
-            if zombie.respawn_timer >= zombie.respawn_delay:
-                current_pos = random.choice(holes_center)
-                zombie.play_idle()
-                zombie.reset()
+        # Advance the round: timer, zombie stay/death/respawn (engine.GameSession)
+        if session:
+            if session.playing:
+                session.tick(dt)
+            for event in session.drain_events():
+                kind = event["event"]
+                if kind == "hit":
+                    music.play_sound("hit")
+                    particles.splatter(session.current_pos)
+                    print("Click: HIT")
+                elif kind == "miss":
+                    # Fallback sound/UX if they clicked empty space:
+                    music.play_sound("miss")
+                    particles.dust(event["pos"])
+                elif kind == "escaped":
+                    print("Click: MISS")
+                elif kind == "end":
+                    # Show replay board when game ends
+                    show_replay_board = True
+                    if leaderboard:
+                        played_at = leaderboard.submit(session.difficulty, session.score,
+                                                       session.hits, session.misses)
+            scoreboard.sync(session.score, session.hits, session.misses,
+                            session.time_limit - int(session.elapsed))
+        playing = session is not None and session.playing
+        current_pos = session.current_pos if session else None
+
+        particles.update(dt)
 
         # Draw function
         bg.draw(holes_positions)
@@ -247,23 +283,80 @@ def main():
             zombie.draw(current_pos)
             if zombie.state == 'idle' and zombie.respawn_timer <= 0:
                 zombie.bar_draw(current_pos)
+            particles.draw()
         
         # Draw replay board if game is over
         if show_menu:
             menu.draw(difficulty)
         elif show_replay_board:
-            replay_board.draw(scoreboard.score, scoreboard.hits, scoreboard.misses)
+            rankings = leaderboard.top(difficulty) if leaderboard else None
+            replay_board.draw(scoreboard.score, scoreboard.hits, scoreboard.misses,
+                              rankings, played_at)
             
         if show_menu or show_replay_board:
             pygame.mouse.set_visible(True)
         else:
             pygame.mouse.set_visible(False)
-            cursor.draw(dt)
+            cursor.draw(dt, RENDERER.mouse_pos())
+
+        if show_stats:
+            assets_mb = RESOURCES.total_bytes / 2**20
+            jitter = pacer.stats()
+            stats_text = scoreboard.font.render(
+                f"{pacer.current_fps:.0f} FPS  {governor.tier.name}  {assets_mb:.1f} MB", True, (255, 255, 0))
+            SCREEN.blit(stats_text, stats_text.get_rect(topright=(SCREEN_WIDTH - 20, 20)))
+            pacing_text = scoreboard.font.render(
+                f"{pacer.strategy} +-{jitter['stddev_ms']:.2f} ms  {pacer.dropped} dropped", True, (255, 255, 0))
+            SCREEN.blit(pacing_text, pacing_text.get_rect(topright=(SCREEN_WIDTH - 20, 50)))
+
+        work_end = time.perf_counter()
+        RENDERER.present()
+        if capture:
+            capture.grab()
+        if not pacer.present_waits:
+            work_end = time.perf_counter()
+        if first_frame:
+            # Everything was in before the loading screen got a frame
+            loader.mark("first frame")
+            first_frame = False
+
+        # Step quality down/up based on how long the frame took to produce
+        frame_ms = (work_end - frame_start) * 1000
+        profiler.frame_done(frame_ms)
+        if governor.update(frame_ms):
+            governor.apply(menu, replay_board, scoreboard, zombie, particles)
+
+        # Observers (bots, load harness) see the frame that was just presented
+        if frame_hook:
+            live = playing and zombie.is_target
+            frame_hook({
+                "time": time.perf_counter(),
+                "frame_ms": frame_ms,
+                "quality": governor.tier.name,
+                "pacing": pacer.strategy,
+                "playing": playing,
+                "show_menu": show_menu,
+                "show_replay_board": show_replay_board,
+                "difficulty": difficulty,
+                "target": current_pos if live else None,
+                "spawn": zombie.spawns,
+                "stay": zombie.stay_timer,
+                "score": scoreboard.score,
+                "hits": scoreboard.hits,
+                "misses": scoreboard.misses,
+                "play_button": menu.start_btn_rect.center,
+                "right_arrow": menu.r_rect.center,
+                "hit_test": zombie.hit_test,
+            })
 
-        pg.display.flip()
-        clock.tick(FPS)  
+        pacer.wait()
 
     # Quit
+    if leaderboard:
+        leaderboard.close()
+    if capture:
+        capture.close()
+    profiler.close()
     pg.quit()
     sys.exit(0)
 
@@ -2,28 +2,21 @@
 from pathlib import Path
 from typing import List, Tuple, Optional
 import pygame as pg
+try:
+    from .engine import ZombieState, frame_paths, zombie_masks
+    from .resources import RESOURCES
+except ImportError:
+    from engine import ZombieState, frame_paths, zombie_masks
+    from resources import RESOURCES
 
 ASSETS = Path(__file__).resolve().parent.parent / "assets" / "images" / "zombies"
 
-class Zombies:
+class Zombies(ZombieState):
     def __init__(self, screen: pg.Surface, z_size: int,
                  idle_fps: float = 10.0, death_fps: float = 12.0,
                  linger_after_death: float = 0.4):
         self.screen = screen
         self.size = (z_size, z_size)
-        self.idle_fps = idle_fps
-        self.death_fps = death_fps
-        self.linger_after_death = linger_after_death
-
-        # State
-        self.state: str = "idle"   # "idle" | "death"
-        self.index: int = 0
-        self.accum: float = 0.0
-        self.frame_time: float = 1.0 / self.idle_fps
-        self.loop: bool = True
-        self.finished: bool = False
-        self.linger: float = 0.0
-        self.hit: bool = False
 
         # Visuals
         self.image: Optional[pg.Surface] = None
@@ -37,89 +30,55 @@ class Zombies:
             raise RuntimeError(f"No idle frames found in {ASSETS / 'idle'}")
         if not self.death_frames:
             print(f"[Zombies] Warning: no death frames found in {ASSETS / 'death'}")
-        
+
+        # State, timers and hit masks (the same ones the server uses, see engine.py)
+        masks = zombie_masks(self.size, (self.idle_frames, self.death_frames))
+        super().__init__(len(self.idle_frames), len(self.death_frames),
+                         idle_fps, death_fps, linger_after_death, masks=masks)
+
         self.image = self.idle_frames[0]
         self.rect = self.image.get_rect(topleft=(0, 0))
 
-        # Property
-        self.idle_cycle = (len(self.idle_frames) / self.idle_fps) if self.idle_fps > 0 else 0.6   
-        self.stay_timer = 2.0 * self.idle_cycle       
-        self.respawn_delay = 0.1           
-        self.respawn_timer = 0.0
+        # Quality settings (visual only, timers are unaffected)
+        self.anim_stride = 1
+        self.bar_radius = 4
+
+    @staticmethod
+    def asset_paths() -> List[Path]:
+        """ Frame files loaded by __init__, for the background loader """
+        return frame_paths(ASSETS / "idle") + frame_paths(ASSETS / "death")
 
     def load_frames(self, folder: Path) -> List[pg.Surface]:
         """ Loaders """
-        paths = sorted(folder.glob("*.png"), key = numeric_key)
+        paths = frame_paths(folder)
         frames: List[pg.Surface] = []
         for p in paths:
-            img = pg.image.load(str(p)).convert_alpha()
-            if img.get_size() != self.size:
-                img = pg.transform.scale(img, self.size)
-            frames.append(img)
+            frames.append(RESOURCES.image(p, self.size))
         return frames
 
-    def reset(self):
-        """ Reset Properies """
-        self.idle_cycle = (len(self.idle_frames) / self.idle_fps) if self.idle_fps > 0 else 0.6
-        self.stay_timer = 2.0 * self.idle_cycle                  
-        self.respawn_timer = 0.0 
-        self.hit = False
-        
     # --- Controls ---
     def play_idle(self):
         """ Setting for Idle state """
-        self.state = "idle"
-        self.index = 0
-        self.accum = 0.0
-        self.frame_time = 1.0 / self.idle_fps
-        self.loop = True
-        self.finished = False
-        self.linger = 0.0
+        super().play_idle()
         if self.idle_frames:
             self.image = self.idle_frames[0]
 
     def play_death(self):
         """ Setting for Death state """
-        self.state = "death"
-        self.index = 0
-        self.accum = 0.0
-        self.frame_time = 1.0 / self.death_fps
-        self.loop = False
-        self.finished = False
-        self.linger = 0.0
+        super().play_death()
         if self.death_frames:
             self.image = self.death_frames[0]
 
     # --- Update & Draw ---
     def step_frame(self):
         """ Moving to next Frame """
+        shown = self.shown_index
+        super().step_frame()
         frames = self.idle_frames if self.state == "idle" else self.death_frames
-        if not frames:
-            return
-
-        self.index += 1
-        if self.index >= len(frames):
-            if self.loop:
-                self.index = 0
-            else:
-                """ Delaying Time for Death state """
-                self.index = len(frames) - 1
-                self.finished = True
-                self.linger = self.linger_after_death
-
-        self.image = frames[self.index]
-
-    def update(self, dt: float):
-        """ Update new Frame """
-        if self.finished:
-            if self.linger > 0:
-                self.linger -= dt
-            return
-
-        self.accum += dt
-        while self.accum >= self.frame_time:
-            self.accum -= self.frame_time
-            self.step_frame()
+        if frames and (self.index % self.anim_stride == 0 or self.finished):
+            self.image = frames[self.index]
+        else:
+            self.shown_index = shown    # Still drawing the previous frame, hit test that one
 
     def draw(self, center_pos: Tuple[int, int]):
         """Render the Zombie on screen"""
@@ -141,21 +100,12 @@ class Zombies:
         y = int(center_pos[1] - self.size[0] // 2 - 12)
 
         bg_rect = pg.Rect(x, y, BAR_W, BAR_H)
-        pg.draw.rect(self.screen, (35, 35, 35), bg_rect, border_radius = 4)
+        pg.draw.rect(self.screen, (35, 35, 35), bg_rect, border_radius = self.bar_radius)
 
         r = int(255 * (1.0 - fraction))
         g = int(200 * fraction)
         fill_rect = pg.Rect(x + 1, y + 1, int((BAR_W - 2) * fraction), BAR_H - 2)
         
         # Apply linear interpolation from Green to Red
-        pg.draw.rect(self.screen, (r, g, 60), fill_rect, border_radius = 4)         
-        pg.draw.rect(self.screen, (220, 220, 220), bg_rect, width = 1, border_radius = 4)  
-
-    @property
-    def is_finished(self) -> bool:
-        return self.finished
-
-def numeric_key(p: Path):
-    import re
-    m = re.findall(r'(\d+)', p.stem)
-    return [int(x) for x in m] if m else [p.stem]
\ No newline at end of file
+        pg.draw.rect(self.screen, (r, g, 60), fill_rect, border_radius = self.bar_radius)         
+        pg.draw.rect(self.screen, (220, 220, 220), bg_rect, width = 1, border_radius = self.bar_radius)
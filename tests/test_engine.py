@@ -0,0 +1,105 @@
+from src.engine import GameSession, SCORE_PER_HIT
+
+
+def opaque_pixel(session: GameSession):
+    """ Screen position of an opaque pixel of the zombie frame on screen """
+    zombie = session.zombie
+    masks = zombie.idle_masks if zombie.state == "idle" else zombie.death_masks
+    mask = masks[zombie.shown_index]
+    w, h = mask.get_size()
+    cx, cy = session.current_pos
+    x, y = next((x, y) for y in range(h) for x in range(w) if mask.get_at((x, y)))
+    return (int(cx) - w // 2 + x, int(cy) - h // 2 + y)
+
+def started(seed: int = 3, time_limit: float = 5) -> GameSession:
+    session = GameSession(0, time_limit, seed=seed)
+    session.start()
+    return session
+
+
+def test_start_spawns_in_a_hole():
+    session = started()
+    events = session.drain_events()
+    assert [e["event"] for e in events] == ["start", "spawn"]
+    assert session.playing
+    assert session.current_pos in session.holes_center
+    assert events[1]["pos"] == session.current_pos
+
+def test_same_seed_same_spawns():
+    a, b = started(seed=7), started(seed=7)
+    for _ in range(5):
+        assert a.current_pos == b.current_pos
+        a.spawn()
+        b.spawn()
+
+def test_hit_on_opaque_pixel():
+    session = started()
+    session.drain_events()
+    assert session.click(opaque_pixel(session))
+    assert session.drain_events() == [{"event": "hit", "id": 1, "score": SCORE_PER_HIT}]
+    assert (session.score, session.hits, session.clicks) == (SCORE_PER_HIT, 1, 1)
+
+    # The dying zombie can't be hit twice, and it's not a miss either
+    assert not session.click(opaque_pixel(session))
+    assert session.drain_events() == []
+    assert session.hits == 1
+
+def test_transparent_corner_is_a_miss():
+    session = started()
+    session.drain_events()
+    mask = session.zombie.idle_masks[0]
+    w, h = mask.get_size()
+    assert not mask.get_at((0, 0))
+    cx, cy = session.current_pos
+    corner = (int(cx) - w // 2, int(cy) - h // 2)
+    assert not session.click(corner)
+    assert session.drain_events() == [{"event": "miss", "pos": corner}]
+    assert (session.score, session.hits, session.misses, session.clicks) == (0, 0, 0, 1)
+
+def test_hit_test_follows_the_shown_frame():
+    session = started()
+    zombie = session.zombie
+    first, second = zombie.idle_masks[:2]
+    w, h = first.get_size()
+    x, y = next((x, y) for y in range(h) for x in range(w)
+                if first.get_at((x, y)) != second.get_at((x, y)))
+    cx, cy = session.current_pos
+    pos = (int(cx) - w // 2 + x, int(cy) - h // 2 + y)
+
+    zombie.step_frame()
+    assert zombie.shown_index == zombie.index == 1
+    assert zombie.hit_test(pos, session.current_pos) == bool(second.get_at((x, y)))
+    # A client drawing every other frame (anim_stride=2) still shows the first one
+    zombie.shown_index = 0
+    assert zombie.hit_test(pos, session.current_pos) == bool(first.get_at((x, y)))
+
+def test_zombie_escapes_after_its_stay():
+    session = started()
+    session.drain_events()
+    stay = session.zombie.stay_timer
+    session.tick(stay / 2)
+    assert session.drain_events() == []
+    session.tick(stay / 2 + 0.01)
+    events = session.drain_events()
+    assert [e["event"] for e in events] == ["escaped", "spawn"]
+    assert events[0] == {"event": "escaped", "id": 1, "misses": 1}
+    assert events[1]["id"] == 2
+    assert session.misses == 1
+
+def test_round_ends_with_result():
+    session = started(time_limit=1.0)
+    session.click(opaque_pixel(session))
+    session.drain_events()
+    for _ in range(11):
+        session.tick(0.1)
+    events = session.drain_events()
+    end = [e for e in events if e["event"] == "end"]
+    assert len(end) == 1
+    assert end[0] == {"event": "end", **session.result()}
+    assert session.result() == {"difficulty": 0, "score": 1, "hits": 1, "misses": 0,
+                                "clicks": 1, "accuracy": 100.0}
+    assert session.finished and not session.playing
+
+    # Clicks after the end are ignored
+    assert not session.click(opaque_pixel(session))
+    assert session.clicks == 1
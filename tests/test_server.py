@@ -0,0 +1,112 @@
+import asyncio
+import json
+from typing import Dict, List
+
+from src.engine import GameSession
+from src.server import GameServer
+
+
+class Transport:
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+class Writer:
+    """ Collects what the server sends to one client """
+    def __init__(self):
+        self.transport = Transport()
+        self.lines: List[bytes] = []
+
+    def write(self, data: bytes):
+        self.lines += data.splitlines()
+
+    def events(self) -> List[Dict]:
+        events = [json.loads(line) for line in self.lines]
+        self.lines.clear()
+        return events
+
+def connect(**kwargs):
+    server = GameServer(**kwargs)
+    writer = Writer()
+    return server, server.add_client(writer), writer
+
+def start(server, client, writer, seed: int = 1):
+    server.handle_message(client, {"op": "start", "difficulty": 0, "seed": seed})
+    server.tick_client(client, client.last_tick)
+    return writer.events()
+
+
+def test_click_without_a_round_is_an_error():
+    server, client, writer = connect()
+    server.handle_message(client, {"op": "click", "x": 10, "y": 10})
+    assert writer.events() == [{"event": "error", "message": "no round in progress"}]
+    assert client.pending == []
+
+def spawns(session: GameSession, n: int = 12) -> List:
+    """ Where the zombie shows up next, n times """
+    positions = []
+    for _ in range(n):
+        session.spawn()
+        positions.append(session.current_pos)
+    return positions
+
+def test_client_seed_needs_opt_in():
+    local = GameSession(0, seed=5)
+    local.start()
+
+    server, client, writer = connect(client_seeds=True)
+    events = start(server, client, writer, seed=5)
+    assert [e["event"] for e in events] == ["holes", "start", "spawn"]
+    assert events[2]["pos"] == list(local.current_pos)
+    assert spawns(client.session) == spawns(local)
+
+    # Without the flag the server picks the seed
+    server, client, writer = connect()
+    start(server, client, writer, seed=5)
+    assert spawns(client.session) != spawns(local)
+
+def test_clicks_over_max_pending_are_rejected():
+    server, client, writer = connect(max_pending=2)
+    start(server, client, writer)
+    for _ in range(3):
+        server.handle_message(client, {"op": "click", "x": 0, "y": 0})
+    assert writer.events() == [{"event": "rejected", "reason": "rate"}]
+    assert len(client.pending) == 2
+
+def test_off_screen_click_is_rejected_in_order():
+    server, client, writer = connect()
+    server.handle_message(client, {"op": "start", "difficulty": 0})
+    server.handle_message(client, {"op": "click", "x": -5, "y": 10})
+    server.handle_message(client, {"op": "click", "x": 0, "y": 0})
+    server.tick_client(client, client.last_tick)
+    assert [e["event"] for e in writer.events()] == ["holes", "start", "spawn", "rejected", "miss"]
+    assert client.session.clicks == 1
+
+def test_clicks_over_max_cps_are_rejected():
+    server, client, writer = connect(max_cps=2, max_pending=8)
+    start(server, client, writer)
+    for _ in range(3):
+        server.handle_message(client, {"op": "click", "x": 0, "y": 0})
+    server.tick_client(client, client.last_tick)
+    events = writer.events()
+    assert [e["event"] for e in events] == ["miss", "miss", "rejected"]
+    assert events[2]["reason"] == "rate"
+    assert client.session.clicks == 2
+
+def test_oversized_line_gets_an_error_and_closes():
+    async def run():
+        server = GameServer()
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"x" * 70_000 + b"\n")
+            await writer.drain()
+            reply = await asyncio.wait_for(reader.readline(), 5)
+            rest = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+        return json.loads(reply), rest, server
+
+    reply, rest, server = asyncio.run(run())
+    assert reply == {"event": "error", "message": "message too long"}
+    assert rest == b""
+    assert server.clients == {}